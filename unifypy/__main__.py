@@ -4,14 +4,17 @@
 """CLI entry for the `unifypy` command."""
 
 from unifypy.cli.argument_parser import ArgumentParser
-from unifypy.core.context import BuildContext
-from unifypy.core.plugin import PluginManager
-from unifypy.core.engine import Engine
 
 
 def main() -> int:
     args = ArgumentParser.parse_arguments()
 
+    # 解析通过后才加载构建引擎：--help / 参数错误路径
+    # 无需付出引擎及其插件依赖链的导入开销
+    from unifypy.core.context import BuildContext
+    from unifypy.core.plugin import PluginManager
+    from unifypy.core.engine import Engine
+
     # 检查是否是交互式配置模式
     if args.init:
         from unifypy.cli.interactive import InteractiveWizard
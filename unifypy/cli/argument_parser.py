@@ -6,6 +6,7 @@
 """
 
 import argparse
+import functools
 from typing import Any
 
 
@@ -22,6 +23,16 @@ class ArgumentParser:
         Returns:
             argparse.Namespace: 解析后的参数对象
         """
+        return ArgumentParser._build_parser().parse_args()
+
+    # 解析器本身无状态，构建一次后缓存；库用法/测试在同一进程内
+    # 反复调用 parse_arguments 时无需重走全部 add_argument
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _build_parser() -> argparse.ArgumentParser:
+        """
+        构建参数解析器（仅在首次调用时执行）.
+        """
         parser = argparse.ArgumentParser(
             description="UnifyPy 2.0 - 跨平台Python应用打包工具",
             formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -60,7 +71,7 @@ class ArgumentParser:
         # ========== macOS 开发选项 ==========
         ArgumentParser._add_macos_arguments(parser)
 
-        return parser.parse_args()
+        return parser
 
     @staticmethod
     def _add_basic_arguments(parser: argparse.ArgumentParser):
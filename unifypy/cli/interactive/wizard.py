@@ -6,10 +6,10 @@
 """
 
 import json
-import platform
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+from ...core.platforms import normalize_platform
 from .input_handlers import InputHandler
 from .interactive_menu import InteractiveMenu
 from .project_scanner import ProjectScanner
@@ -100,15 +100,8 @@ class InteractiveWizard:
         print()
 
     def _detect_platform(self) -> str:
-        """检测当前操作系统"""
-        system = platform.system()
-        if system == 'Darwin':
-            return 'macos'
-        elif system == 'Windows':
-            return 'windows'
-        elif system == 'Linux':
-            return 'linux'
-        return 'linux'
+        """检测当前操作系统（normalize_platform 底层缓存 uname 调用）"""
+        return normalize_platform()
 
     def _collect_basic_config(self):
         """收集基础配置"""
@@ -4,6 +4,7 @@
 配置管理系统 处理配置文件加载、合并和验证.
 """
 
+import copy
 import json
 import os
 from .platforms import normalize_platform
@@ -11,6 +12,25 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 
+# 进程内配置解析缓存：以 (mtime_ns, size) 为键检测文件变更。
+# 库用法/并行构建会在同一进程里多次构造 ConfigManager，
+# 未变更的配置文件无需重复走 JSON 解析。
+_parsed_config_cache: Dict[str, tuple] = {}
+
+# get() 嵌套键查找的缺失哨兵（None 是合法配置值，不能用作哨兵）
+_MISSING = object()
+
+# 可选依赖：orjson 的解析比 stdlib json 快数倍，且原生接受 bytes；
+# 未安装时回退 stdlib（json.loads 同样接受 bytes，省去 TextIOWrapper
+# 的增量解码）
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
 class ConfigManager:
     """
     配置管理器，处理配置合并和验证.
@@ -27,6 +47,9 @@ class ConfigManager:
         self.args = args or {}
         self.raw_config = {}
         self.merged_config = {}
+        # get_pyinstaller_config 的合并结果缓存；merged_config 被
+        # 外部修改后需调用 invalidate_derived_config 失效
+        self._pyinstaller_config_cache = None
         self.current_platform = self._detect_platform()
         
         # 获取项目目录用于路径解析
@@ -38,6 +61,15 @@ class ConfigManager:
         if config_path:
             self.raw_config = self._load_config(config_path)
 
+        # raw_config 是否非空：后续多个方法都要做这个判断，固化成
+        # 单次属性读（大字典的真值判断仍要走 len）
+        self._has_raw = bool(self.raw_config)
+
+        # 平台特定配置只依赖 raw_config 与当前平台，构造时计算一次；
+        # 后续合并/校验/派生配置全部复用，避免重复的字典探测
+        self._platform_cfg = self._get_platform_config()
+        self._platform_cfg_keys = frozenset(self._platform_cfg)
+
         self.merged_config = self._merge_all_configs()
         self._validate_config()
     
@@ -209,13 +241,27 @@ class ConfigManager:
             FileNotFoundError: 配置文件不存在
             json.JSONDecodeError: 配置文件格式错误
         """
-        if not os.path.exists(config_path):
+        try:
+            stat = os.stat(config_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"配置文件不存在: {config_path}")
 
+        # 命中缓存时跳过解析；返回深拷贝避免调用方修改污染缓存
+        cache_key = os.path.abspath(config_path)
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = _parsed_config_cache.get(cache_key)
+        if cached and cached[0] == file_key:
+            return copy.deepcopy(cached[1])
+
         try:
-            with open(config_path, "r", encoding="utf-8-sig") as f:
-                config = json.load(f)
-                return config
+            with open(config_path, "rb") as f:
+                raw = f.read()
+            # 等价原来的 utf-8-sig：手动剥掉 BOM（orjson 不接受 BOM）
+            if raw.startswith(b"\xef\xbb\xbf"):
+                raw = raw[3:]
+            config = _json_loads(raw)
+            _parsed_config_cache[cache_key] = (file_key, config)
+            return copy.deepcopy(config)
         except json.JSONDecodeError as e:
             raise json.JSONDecodeError(f"配置文件格式错误: {e}", e.doc, e.pos)
         except Exception as e:
@@ -273,11 +319,11 @@ class ConfigManager:
         merged = default_config.copy()
 
         # 深度合并文件配置的全局部分
-        if self.raw_config:
+        if self._has_raw:
             global_config = {
                 k: v
                 for k, v in self.raw_config.items()
-                if k not in ["platform_specific", "platforms"]
+                if k not in self._PLATFORM_META_KEYS
             }
             merged = self._deep_merge(merged, global_config)
             # 保留完整平台配置，供下游读取
@@ -287,7 +333,7 @@ class ConfigManager:
                 merged["platform_specific"] = self.raw_config["platform_specific"]
 
         # 深度合并平台特定配置（排除安装器专属键）
-        platform_config = self._get_platform_config()
+        platform_config = self._platform_cfg
         if platform_config:
             platform_general = {
                 k: v for k, v in platform_config.items()
@@ -323,7 +369,7 @@ class ConfigManager:
         Returns:
             Dict[str, Any]: 平台特定配置
         """
-        if not self.raw_config:
+        if not self._has_raw:
             return {}
 
         # 尝试新格式 (platforms)
@@ -338,6 +384,34 @@ class ConfigManager:
 
         return {}
 
+    # CLI 可覆盖的 PyInstaller 相关键（frozenset 可与 dict_keys
+    # 直接求交集；类级常量，避免每次调用重建）
+    _CLI_PYINSTALLER_KEYS = frozenset({
+        "onefile", "windowed", "console", "icon", "name",
+        "distpath", "workpath", "specpath",
+        "debug", "clean", "noconfirm", "strip", "noupx", "optimize",
+    })
+
+    # 命令行参数到配置键的声明式映射表（参数名与配置键同名，直接平移；
+    # 类级常量，避免每次合并时重建）
+    _DIRECT_ARG_KEYS = (
+        "name",
+        "display_name",
+        "entry",
+        "version",
+        "publisher",
+        "icon",
+        "license",
+        "readme",
+        "hooks",
+        "onefile",
+        "windowed",
+        "console",
+        "skip_installer",
+        "skip_exe",
+        "inno_setup_path",
+    )
+
     def _args_to_config(self, args: Dict[str, Any]) -> Dict[str, Any]:
         """将命令行参数转换为配置格式.
 
@@ -347,32 +421,37 @@ class ConfigManager:
         Returns:
             Dict[str, Any]: 配置字典
         """
-        config = {}
-
-        # 直接映射的参数
-        direct_mappings = {
-            "name": "name",
-            "display_name": "display_name",
-            "entry": "entry",
-            "version": "version",
-            "publisher": "publisher",
-            "icon": "icon",
-            "license": "license",
-            "readme": "readme",
-            "hooks": "hooks",
-            "onefile": "onefile",
-            "windowed": "windowed",
-            "console": "console",
-            "skip_installer": "skip_installer",
-            "skip_exe": "skip_exe",
-            "inno_setup_path": "inno_setup_path",
+        return {
+            key: args[key]
+            for key in self._DIRECT_ARG_KEYS
+            if args.get(key) is not None
         }
 
-        for arg_key, config_key in direct_mappings.items():
-            if arg_key in args and args[arg_key] is not None:
-                config[config_key] = args[arg_key]
-
-        return config
+    # 必需的顶层配置键
+    _REQUIRED_FIELDS = ("name", "entry")
+
+    # raw_config 中的平台元数据键（不参与全局合并/重复检查；
+    # frozenset 可与 dict_keys 直接做集合差，无中间 set 分配）
+    _PLATFORM_META_KEYS = frozenset({"platform_specific", "platforms"})
+
+    # 顶层配置键的类型约束（声明式 schema，构造时一次性校验，
+    # 让类型错误在构建开始前暴露，而不是在 PyInstaller 跑完之后）
+    _TYPE_SCHEMA = (
+        ("name", str),
+        ("display_name", str),
+        ("entry", str),
+        ("version", str),
+        ("publisher", str),
+        ("icon", str),
+        ("license", str),
+        ("readme", str),
+        ("hooks", str),
+        ("onefile", bool),
+        ("windowed", bool),
+        ("console", bool),
+        ("pyinstaller", dict),
+        ("platforms", dict),
+    )
 
     def _validate_config(self):
         """
@@ -382,32 +461,55 @@ class ConfigManager:
         warnings = []
 
         # 检查必需字段
-        required_fields = ["name", "entry"]
-        for field in required_fields:
+        for field in self._REQUIRED_FIELDS:
             if not self.merged_config.get(field):
                 errors.append(f"缺少必需配置项: {field}")
 
-        # 检查文件路径
-        entry_file = self.merged_config.get("entry")
-        if entry_file:
-            entry_full_path = self.resolve_path(entry_file)
-            if not entry_full_path.exists():
-                errors.append(f"入口文件不存在: {entry_file}")
-
-        icon_file = self.merged_config.get("icon")
-        if icon_file:
-            icon_full_path = self.resolve_path(icon_file)
-            if not icon_full_path.exists():
-                warnings.append(f"图标文件不存在: {icon_file}")
-        
-        # 检查其他可能的文件路径
-        file_fields = ["license", "readme"]
-        for field in file_fields:
+        # 类型校验：错误类型的配置值在此处直接报错，下游代码
+        # 不再需要各自防御
+        for field, expected in self._TYPE_SCHEMA:
+            value = self.merged_config.get(field)
+            if value is not None and not isinstance(value, expected):
+                errors.append(
+                    f"配置项 {field} 类型错误: 期望 {expected.__name__}, "
+                    f"实际 {type(value).__name__}"
+                )
+
+        # platforms 下每个平台的配置必须是字典，formats 必须是字符串列表
+        platforms = self.merged_config.get("platforms")
+        if isinstance(platforms, dict):
+            for platform_name, platform_config in platforms.items():
+                if not isinstance(platform_config, dict):
+                    errors.append(
+                        f"platforms.{platform_name} 类型错误: 期望 dict, "
+                        f"实际 {type(platform_config).__name__}"
+                    )
+                    continue
+                formats = platform_config.get("formats")
+                if formats is not None and (
+                    not isinstance(formats, list)
+                    or not all(isinstance(f, str) for f in formats)
+                ):
+                    errors.append(
+                        f"platforms.{platform_name}.formats 必须是字符串列表"
+                    )
+
+        # 检查文件路径：单次循环、os.stat try/except 探测
+        # （入口文件缺失是错误，其余资源文件缺失仅告警）
+        file_checks = (
+            ("entry", "入口文件不存在: {}", errors),
+            ("icon", "图标文件不存在: {}", warnings),
+            ("license", "license文件不存在: {}", warnings),
+            ("readme", "readme文件不存在: {}", warnings),
+        )
+        for field, message, sink in file_checks:
             file_path = self.merged_config.get(field)
-            if file_path:
-                full_path = self.resolve_path(file_path)
-                if not full_path.exists():
-                    warnings.append(f"{field}文件不存在: {file_path}")
+            if not file_path:
+                continue
+            try:
+                os.stat(self.resolve_path(file_path))
+            except OSError:
+                sink.append(message.format(file_path))
 
         # 检查重复配置
         duplicates = self._check_duplicate_configs()
@@ -430,15 +532,14 @@ class ConfigManager:
         """
         duplicates = []
 
-        if not self.raw_config:
+        if not self._has_raw:
             return duplicates
 
-        # 获取全局配置的键
-        global_keys = set(self.raw_config.keys()) - {"platform_specific", "platforms"}
+        # 获取全局配置的键（dict_keys 直接减 frozenset）
+        global_keys = self.raw_config.keys() - self._PLATFORM_META_KEYS
 
-        # 检查平台配置中的重复项
-        platform_config = self._get_platform_config()
-        platform_keys = set(platform_config.keys())
+        # 检查平台配置中的重复项（键集合在构造时已固化为 frozenset）
+        platform_keys = self._platform_cfg_keys
 
         duplicate_keys = global_keys.intersection(platform_keys) - self.EXPECTED_OVERRIDE_KEYS
         duplicates.extend(duplicate_keys)
@@ -455,38 +556,41 @@ class ConfigManager:
         Returns:
             Any: 配置值
         """
-        keys = key.split(".")
-        value = self.merged_config
+        # 快路径：绝大多数访问是顶层键，免掉 split 分配和循环
+        if "." not in key:
+            return self.merged_config.get(key, default)
 
-        try:
-            for k in keys:
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+        value = self.merged_config
+        for k in key.split("."):
+            if not isinstance(value, dict):
+                return default
+            value = value.get(k, _MISSING)
+            if value is _MISSING:
+                return default
+        return value
 
     def get_pyinstaller_config(self) -> Dict[str, Any]:
         """获取PyInstaller配置.
 
         优先级: CLI参数 > 平台pyinstaller > 全局pyinstaller > 顶层通用键
 
+        合并结果按实例缓存：各插件在每个阶段都会重复调用，配置在
+        构建期间基本不变，无需每次重走深合并。返回深拷贝，调用方
+        可以安全修改。
+
         Returns:
             Dict[str, Any]: PyInstaller配置
         """
-        # CLI 可覆盖的 PyInstaller 相关键
-        _CLI_PYINSTALLER_KEYS = [
-            "onefile", "windowed", "console", "icon", "name",
-            "distpath", "workpath", "specpath",
-            "debug", "clean", "noconfirm", "strip", "noupx", "optimize",
-        ]
-
-        config = {}
-
-        # Step 1: 从 merged_config 顶层取通用键作为基础
-        for key in _CLI_PYINSTALLER_KEYS:
-            value = self.merged_config.get(key)
-            if value is not None:
-                config[key] = value
+        if self._pyinstaller_config_cache is not None:
+            return copy.deepcopy(self._pyinstaller_config_cache)
+
+        # Step 1: 从 merged_config 顶层取通用键作为基础（一次集合
+        # 交集替代逐键 get，只触碰实际存在的键）
+        config = {
+            key: self.merged_config[key]
+            for key in self._CLI_PYINSTALLER_KEYS & self.merged_config.keys()
+            if self.merged_config[key] is not None
+        }
 
         # Step 2: 合并全局 pyinstaller section（merged_config 中已包含平台合并结果）
         pyinstaller_section = self.merged_config.get("pyinstaller", {})
@@ -494,18 +598,28 @@ class ConfigManager:
 
         # Step 3: CLI 参数以最高优先级覆盖
         if self.args:
-            for key in _CLI_PYINSTALLER_KEYS:
+            for key in self._CLI_PYINSTALLER_KEYS:
                 if key in self.args and self.args[key] is not None:
                     config[key] = self.args[key]
 
         # macOS: 从平台配置中映射 bundle_identifier
         if self.current_platform == "macos":
-            platform_config = self._get_platform_config()
+            platform_config = self._platform_cfg
             if "bundle_identifier" in platform_config:
                 config["osx_bundle_identifier"] = platform_config["bundle_identifier"]
 
+        self._pyinstaller_config_cache = copy.deepcopy(config)
         return config
 
+    def invalidate_derived_config(self):
+        """失效派生配置缓存.
+
+        直接修改 merged_config 的调用方（如图标预处理、macOS
+        entitlements 合并）修改后必须调用本方法，否则
+        get_pyinstaller_config 会继续返回旧的合并结果。
+        """
+        self._pyinstaller_config_cache = None
+
     def get_platform_installer_config(self, installer_type: str) -> Dict[str, Any]:
         """获取平台特定安装器配置.
 
@@ -515,8 +629,7 @@ class ConfigManager:
         Returns:
             Dict[str, Any]: 安装器配置
         """
-        platform_config = self._get_platform_config()
-        return platform_config.get(installer_type, {})
+        return self._platform_cfg.get(installer_type, {})
 
     def get_app_info(self) -> Dict[str, Any]:
         """获取应用程序基本信息.
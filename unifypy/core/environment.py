@@ -5,12 +5,76 @@
 支持现代化的规范化架构映射系统 (2024 标准)
 """
 
+import functools
 import platform
 import subprocess
 import locale
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from .platforms import normalize_platform
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_linux_c_runtime() -> str:
+    """探测 Linux C 运行时（glibc/musl），进程内缓存.
+
+    每个打包器都会实例化一个 EnvironmentManager，逐次 fork
+    `ldd --version` 探测毫无必要：结果在进程生命周期内不会变化。
+
+    Returns:
+        str: 'glibc' 或 'musl'
+    """
+    try:
+        # 检测 ldd --version 是否包含 musl
+        result = subprocess.run(
+            ["ldd", "--version"],
+            capture_output=True,
+            text=True,
+            encoding=locale.getpreferredencoding(False) or 'utf-8',
+            errors='replace',
+            timeout=5
+        )
+        output = result.stderr.lower() + result.stdout.lower()
+
+        if "musl" in output:
+            return "musl"
+        else:
+            return "glibc"  # 默认为 glibc (manylinux)
+
+    except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
+        # 备用检测方法：检查 /lib/libc.musl* 文件
+        try:
+            musl_files = list(Path("/lib").glob("libc.musl*"))
+            if musl_files:
+                return "musl"
+        except Exception:
+            pass
+
+        # 默认假设为 glibc
+        return "glibc"
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_rosetta() -> bool:
+    """探测是否运行在 macOS Rosetta 下，进程内缓存.
+
+    Returns:
+        bool: 是否在 Rosetta 下运行
+    """
+    try:
+        result = subprocess.run(
+            ["sysctl", "-in", "sysctl.proc_translated"],
+            capture_output=True,
+            text=True,
+            encoding=locale.getpreferredencoding(False) or 'utf-8',
+            errors='replace',
+            timeout=5
+        )
+        return result.stdout.strip() == "1"
+    except Exception:
+        return False
+
 
 class EnvironmentManager:
     """
@@ -35,18 +99,20 @@ class EnvironmentManager:
         self.normalized_arch = self._normalize_architecture()
         self.c_runtime = self._detect_c_runtime() if self.current_platform == "linux" else None
         self.internal_key = self._generate_internal_key()
+        # get_platform_info 的结果在进程生命周期内不会变化，按实例缓存
+        self._platform_info_cache = None
 
     def _detect_platform(self) -> str:
         """
         检测当前平台.
         """
-        system = platform.system().lower()
-        if system == "darwin":
+        # normalize_platform 底层缓存了 platform.system()（部分系统
+        # 上该调用要走 uname），这里只做内部键的映射
+        system = normalize_platform()
+        if system == "macos":
             return "mac"
         elif system == "windows":
             return "win"
-        elif system == "linux":
-            return "linux"
         else:
             return system
 
@@ -89,35 +155,8 @@ class EnvironmentManager:
         """
         if self.current_platform != "linux":
             return None
-            
-        try:
-            # 检测 ldd --version 是否包含 musl
-            result = subprocess.run(
-                ["ldd", "--version"],
-                capture_output=True,
-                text=True,
-                encoding=locale.getpreferredencoding(False) or 'utf-8',
-                errors='replace',
-                timeout=5
-            )
-            output = result.stderr.lower() + result.stdout.lower()
-            
-            if "musl" in output:
-                return "musl"
-            else:
-                return "glibc"  # 默认为 glibc (manylinux)
-                
-        except (subprocess.TimeoutExpired, subprocess.CalledProcessError, FileNotFoundError):
-            # 备用检测方法：检查 /lib/libc.musl* 文件
-            try:
-                musl_files = list(Path("/lib").glob("libc.musl*"))
-                if musl_files:
-                    return "musl"
-            except Exception:
-                pass
-
-            # 默认假设为 glibc
-            return "glibc"
+
+        return _probe_linux_c_runtime()
 
     def _is_rosetta(self) -> bool:
         """
@@ -129,18 +168,7 @@ class EnvironmentManager:
         if self.current_platform != "mac":
             return False
 
-        try:
-            result = subprocess.run(
-                ["sysctl", "-in", "sysctl.proc_translated"],
-                capture_output=True,
-                text=True,
-                encoding=locale.getpreferredencoding(False) or 'utf-8',
-                errors='replace',
-                timeout=5
-            )
-            return result.stdout.strip() == "1"
-        except Exception:
-            return False
+        return _probe_rosetta()
 
     def _generate_internal_key(self) -> str:
         """
@@ -354,9 +382,15 @@ class EnvironmentManager:
     def get_platform_info(self) -> Dict[str, Any]:
         """获取平台信息 (现代化版本).
 
+        结果按实例缓存：platform.version()/processor() 等调用在部分
+        系统上要读注册表或 /proc，信息在进程内不会变化。
+
         Returns:
-            Dict[str, Any]: 平台信息字典
+            Dict[str, Any]: 平台信息字典（副本，调用方可安全修改）
         """
+        if self._platform_info_cache is not None:
+            return dict(self._platform_info_cache)
+
         info = {
             "platform": self.current_platform,
             "raw_architecture": self.current_arch,
@@ -386,8 +420,9 @@ class EnvironmentManager:
         
         # 添加推荐目标
         info["recommended_targets"] = self.get_recommended_targets()
-        
-        return info
+
+        self._platform_info_cache = info
+        return dict(info)
 
     def check_prerequisites(self) -> Dict[str, bool]:
         """检查构建前提条件 (现代化版本).
@@ -405,14 +440,15 @@ class EnvironmentManager:
         # 检查架构支持
         results["architecture_supported"] = self.is_supported_architecture()
 
-        # 检查必要库
-        libraries = ["pyinstaller", "rich", "requests"]
-        for lib in libraries:
-            try:
-                __import__(lib)
-                results[lib] = True
-            except ImportError:
-                results[lib] = False
+        # 检查必要库：find_spec 只在 sys.path 上查找模块规格，不执行
+        # 包的 __init__（__import__ 会连带加载 rich/requests 的全部
+        # 依赖树，仅为探测存在性代价过高）。注意 PyInstaller 的导入
+        # 名是大小写敏感的
+        from importlib.util import find_spec
+
+        libraries = {"pyinstaller": "PyInstaller", "rich": "rich", "requests": "requests"}
+        for lib, module_name in libraries.items():
+            results[lib] = find_spec(module_name) is not None
 
         return results
 
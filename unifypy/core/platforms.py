@@ -7,10 +7,23 @@
 统一对外架构键：x64 / arm64（仅支持 64 位；不支持 32 位/armv7）
 """
 
+import functools
 import platform as _platform
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=1)
+def _system_lower() -> str:
+    """进程内缓存的 platform.system()（部分系统上会调用 uname）。"""
+    return _platform.system().lower()
+
+
+@functools.lru_cache(maxsize=1)
+def _machine_lower() -> str:
+    """进程内缓存的 platform.machine()。"""
+    return _platform.machine().lower()
+
+
 # 对外平台名常量
 PLATFORM_WINDOWS = "windows"
 PLATFORM_MACOS = "macos"
@@ -23,7 +36,7 @@ def normalize_platform(system: Optional[str] = None) -> str:
     Args:
         system: 原始平台字符串（可选）；默认读取 platform.system().lower()
     """
-    s = (system or _platform.system()).lower()
+    s = system.lower() if system else _system_lower()
     if s == "darwin":
         return PLATFORM_MACOS
     if s.startswith("win"):
@@ -42,7 +55,7 @@ def normalize_arch(machine: Optional[str] = None) -> str:
     - aarch64/arm64/armv8* → arm64
     其他（如 armv7/armhf/i386 等 32 位）均视为不支持并抛出异常。
     """
-    m = (machine or _platform.machine()).lower()
+    m = machine.lower() if machine else _machine_lower()
     if m in ("x86_64", "amd64"):
         return "x64"
     if m in ("aarch64", "arm64", "armv8", "armv8l"):
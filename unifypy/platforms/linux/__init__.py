@@ -2,10 +2,27 @@
 # -*- coding: utf-8 -*-
 """
 Linux平台打包器.
-"""
 
-from .appimage_packager import AppImagePackager
-from .deb_packager import DEBPackager
-from .rpm_packager import RPMPackager
+打包器类按需懒加载（PEP 562）：只构建单一格式时，其余格式的
+打包器模块（及其外部工具探测）完全不会导入。
+"""
 
 __all__ = ["AppImagePackager", "DEBPackager", "RPMPackager"]
+
+# 类名 -> 所在子模块
+_LAZY_PACKAGERS = {
+    "AppImagePackager": ".appimage_packager",
+    "DEBPackager": ".deb_packager",
+    "RPMPackager": ".rpm_packager",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_PACKAGERS:
+        from importlib import import_module
+
+        cls = getattr(import_module(_LAZY_PACKAGERS[name], __name__), name)
+        # 缓存到模块命名空间，后续访问不再经过 __getattr__
+        globals()[name] = cls
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
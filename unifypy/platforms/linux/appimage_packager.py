@@ -6,12 +6,14 @@ Linux AppImage 打包器 创建便携式 AppImage 格式的应用包.
 AppImage 是一种便携式应用格式，无需安装即可在大多数 Linux 发行版上运行。
 """
 
+import concurrent.futures
 import os
-import shutil
 import tempfile
 from pathlib import Path
 from typing import Any, Dict, List
 
+from ...utils.command_runner import cached_which
+from ...utils.file_ops import fast_copyfile, stage_dist_tree, write_pieces
 from ..base import BasePackager
 
 
@@ -63,17 +65,25 @@ class AppImagePackager(BasePackager):
             app_dir = Path(temp_dir) / "AppDir"
             app_dir.mkdir()
 
-            # 安装应用文件到 AppDir
-            self._install_application(source_path, app_dir, appimage_config)
-
-            # 创建 AppRun 启动脚本
-            self._create_apprun(app_dir, appimage_config)
-
-            # 创建桌面文件
-            self._create_desktop_file(app_dir, appimage_config)
-
-            # 复制图标文件
-            self._copy_icon(app_dir, appimage_config)
+            # AppImage name: prefer format-specific "name" field if provided
+            # （派生名只在此处计算一次，传给各辅助方法）
+            app_name = appimage_config.get("name", self.config.get("name", "myapp"))
+
+            # AppDir 准备的四个步骤互相独立（写入不同文件），且均为
+            # I/O 型（树复制走零拷贝系统调用、其余是小文件写入），
+            # 用线程池并发执行，整体耗时约等于最慢一步（树复制）
+            tasks = [
+                lambda: self._install_application(source_path, app_dir, appimage_config),
+                lambda: self._create_apprun(app_dir, appimage_config),
+                lambda: self._create_desktop_file(app_dir, appimage_config, app_name),
+                lambda: self._copy_icon(app_dir, appimage_config, app_name),
+            ]
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=len(tasks)
+            ) as executor:
+                futures = [executor.submit(task) for task in tasks]
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
 
             # 构建 AppImage
             success = self._build_appimage(app_dir, output_path)
@@ -97,19 +107,17 @@ class AppImagePackager(BasePackager):
         app_name = self.config.get("name", "myapp")
 
         if source_path.is_file():
-            # 单个可执行文件
-            shutil.copy2(source_path, app_dir / app_name)
+            # 单个可执行文件（零拷贝路径，元数据等价 copy2）
+            fast_copyfile(str(source_path), str(app_dir / app_name))
             (app_dir / app_name).chmod(0o755)
         else:
-            # 目录 - 复制所有内容
-            for item in source_path.iterdir():
-                if item.is_dir():
-                    shutil.copytree(item, app_dir / item.name, symlinks=True)
-                else:
-                    shutil.copy2(item, app_dir / item.name)
-                    # 保持可执行权限
-                    if os.access(item, os.X_OK):
-                        (app_dir / item.name).chmod(0o755)
+            # 目录 - 复制所有内容（sendfile/copy_file_range 零拷贝路径，
+            # copystat 保留可执行权限，符号链接按原样保留）
+            stage_dist_tree(
+                str(source_path),
+                str(app_dir),
+                use_iouring=config.get("use_iouring", False),
+            )
 
     def _create_apprun(self, app_dir: Path, config: Dict[str, Any]):
         """
@@ -141,25 +149,24 @@ cd "$SELF_DIR" || exit 1
 exec "$SELF_DIR/{app_name}" "$@"
 """
 
-        with open(apprun_path, "w", encoding="utf-8") as f:
-            f.write(apprun_content)
+        write_pieces(apprun_path, [apprun_content])
 
         # 设置可执行权限
         apprun_path.chmod(0o755)
 
-    def _create_desktop_file(self, app_dir: Path, config: Dict[str, Any]):
+    def _create_desktop_file(
+        self, app_dir: Path, config: Dict[str, Any], app_name: str
+    ):
         """
         创建 .desktop 文件.
 
         desktop 文件定义了应用的元数据和启动方式。
         """
-        # AppImage name: prefer format-specific "name" field if provided
-        app_name = config.get("name", self.config.get("name", "myapp"))
         # Display name: can be non-ASCII, used in .desktop Name= field
         display_name = self.config.get("display_name", self.config.get("name", app_name))
 
-        # 桌面文件内容
-        desktop_content = f"""[Desktop Entry]
+        # 桌面文件内容（单次列表拼装 + 一次写入）
+        parts = [f"""[Desktop Entry]
 Type=Application
 Name={display_name}
 Exec={app_name}
@@ -168,27 +175,26 @@ Comment={config.get('comment', self.config.get('description', display_name))}
 Categories={config.get('categories', 'Utility;')}
 Terminal={str(config.get('terminal', False)).lower()}
 Version={self.config.get('version', '1.0.0')}
-"""
+"""]
 
         # 添加可选字段
         if config.get("generic_name"):
-            desktop_content += f"GenericName={config['generic_name']}\n"
+            parts.append(f"GenericName={config['generic_name']}\n")
 
         if config.get("keywords"):
             keywords = config["keywords"]
             if isinstance(keywords, list):
                 keywords = ";".join(keywords)
-            desktop_content += f"Keywords={keywords};\n"
+            parts.append(f"Keywords={keywords};\n")
 
         # 写入桌面文件
         desktop_file = app_dir / f"{app_name}.desktop"
-        with open(desktop_file, "w", encoding="utf-8") as f:
-            f.write(desktop_content)
+        write_pieces(desktop_file, parts)
 
         # 设置可执行权限（AppImage 规范要求）
         desktop_file.chmod(0o755)
 
-    def _copy_icon(self, app_dir: Path, config: Dict[str, Any]):
+    def _copy_icon(self, app_dir: Path, config: Dict[str, Any], app_name: str):
         """
         复制图标文件到 AppDir.
 
@@ -197,14 +203,12 @@ Version={self.config.get('version', '1.0.0')}
         - 支持 PNG, SVG 格式
         - 推荐尺寸：256x256 或更大
         """
-        # AppImage name: prefer format-specific "name" field if provided
-        app_name = config.get("name", self.config.get("name", "myapp"))
         icon_path = config.get("icon") or self.config.get("icon")
 
         if icon_path and os.path.exists(icon_path):
             icon_ext = Path(icon_path).suffix
             icon_dest = app_dir / f"{app_name}{icon_ext}"
-            shutil.copy2(icon_path, icon_dest)
+            fast_copyfile(str(icon_path), str(icon_dest))
         else:
             # 如果没有图标，创建一个占位符（避免 appimagetool 警告）
             if self.progress:
@@ -231,7 +235,6 @@ Version={self.config.get('version', '1.0.0')}
             "Linux AppImage打包",
             "正在构建 AppImage...",
             80,
-            shell=False,
             env=env,
         )
 
@@ -259,9 +262,9 @@ Version={self.config.get('version', '1.0.0')}
 
         config = self.get_format_config("appimage")
 
-        # 检查 appimagetool 工具
+        # 检查 appimagetool 工具（which 结果进程内缓存）
         try:
-            if not shutil.which("appimagetool"):
+            if not cached_which("appimagetool"):
                 errors.append(
                     "appimagetool 工具未安装\n"
                     "请安装: \n"
@@ -5,11 +5,12 @@ Linux DEB 打包器 创建Debian/Ubuntu格式的安装包.
 """
 
 import os
-import shutil
 import tempfile
 from pathlib import Path
 from typing import Any, Dict, List
 
+from ...utils.command_runner import cached_which
+from ...utils.file_ops import fast_copyfile, stage_dist_tree, write_pieces
 from ..base import BasePackager
 
 
@@ -55,20 +56,33 @@ class DEBPackager(BasePackager):
             build_dir = Path(temp_dir) / "build"
             debian_dir = build_dir / "DEBIAN"
 
-            # 创建目录结构
-            debian_dir.mkdir(parents=True)
-
-            # 安装应用文件
-            self._install_application(source_path, build_dir, deb_config)
+            # 预先算好需要的目录，一次循环批量创建（makedirs 会顺带
+            # 建出共享前缀，exist_ok 让后续路径直接走 isdir 快路径）
+            package_name = deb_config.get(
+                "package", self.config.get("name", "myapp")
+            ).lower()
+            required_dirs = ["DEBIAN", f"opt/{package_name}", "usr/local/bin"]
+            if deb_config.get("create_desktop_file", True):
+                required_dirs.append("usr/share/applications")
+                icon_path = deb_config.get("icon") or self.config.get("icon")
+                if icon_path and os.path.exists(icon_path):
+                    required_dirs.append("usr/share/pixmaps")
+            for rel_dir in required_dirs:
+                (build_dir / rel_dir).mkdir(parents=True, exist_ok=True)
+
+            # 安装应用文件（package_name 等派生值只在此处计算一次）
+            self._install_application(
+                source_path, build_dir, deb_config, package_name
+            )
 
             # 创建控制文件
-            self._create_control_file(debian_dir, deb_config)
+            self._create_control_file(debian_dir, deb_config, package_name)
 
             # 创建脚本文件
             self._create_scripts(debian_dir, deb_config)
 
             # 创建桌面文件
-            self._create_desktop_file(build_dir, deb_config)
+            self._create_desktop_file(build_dir, deb_config, package_name)
 
             # 构建DEB包
             success = self._build_deb_package(build_dir, output_path)
@@ -76,36 +90,34 @@ class DEBPackager(BasePackager):
             return success
 
     def _install_application(
-        self, source_path: Path, build_dir: Path, config: Dict[str, Any]
+        self,
+        source_path: Path,
+        build_dir: Path,
+        config: Dict[str, Any],
+        package_name: str,
     ):
         """
         安装应用文件到构建目录.
         """
         app_name = self.config.get("name", "myapp")
-        # DEB package name: prefer format-specific "package" field (must be ASCII for dpkg)
-        package_name = config.get("package", app_name).lower()
         install_dir = build_dir / "opt" / package_name
 
-        # 创建安装目录
-        install_dir.mkdir(parents=True)
-
         main_executable = self._detect_main_executable(source_path, app_name)
 
         if source_path.is_file():
-            # 单个可执行文件
-            shutil.copy2(source_path, install_dir / main_executable)
+            # 单个可执行文件（零拷贝路径，元数据等价 copy2）
+            fast_copyfile(str(source_path), str(install_dir / main_executable))
             (install_dir / main_executable).chmod(0o755)
         else:
-            # 目录 - 复制所有内容
-            for item in source_path.iterdir():
-                if item.is_file():
-                    shutil.copy2(item, install_dir)
-                else:
-                    shutil.copytree(item, install_dir / item.name)
+            # 目录 - 复制所有内容（sendfile/copy_file_range 零拷贝路径）
+            stage_dist_tree(
+                str(source_path),
+                str(install_dir),
+                use_iouring=config.get("use_iouring", False),
+            )
 
         # 创建符号链接到 /usr/local/bin
         bin_dir = build_dir / "usr" / "local" / "bin"
-        bin_dir.mkdir(parents=True)
 
         # 创建启动脚本
         launcher_script = bin_dir / package_name
@@ -115,8 +127,7 @@ cd /opt/{package_name} || exit 1
 exec "./{main_executable}" "$@"
 """
 
-        with open(launcher_script, "w", encoding="utf-8") as f:
-            f.write(launcher_content)
+        launcher_script.write_text(launcher_content, encoding="utf-8")
         launcher_script.chmod(0o755)
 
     def _detect_main_executable(self, source_path: Path, app_name: str) -> str:
@@ -126,37 +137,51 @@ exec "./{main_executable}" "$@"
         if source_path.is_file():
             return source_path.name
 
-        # 优先匹配与应用名完全一致的文件
-        candidate = source_path / app_name
-        if candidate.exists() and candidate.is_file():
-            return candidate.name
-
-        # 再尝试大小写不敏感匹配
-        for item in source_path.iterdir():
-            if item.is_file() and item.name.lower() == app_name.lower():
-                return item.name
-
-        # 退化为第一个可执行文件
-        for item in source_path.iterdir():
-            if item.is_file() and os.access(item, os.X_OK):
-                return item.name
+        # 单次 scandir 遍历完成三级匹配（DirEntry 缓存 stat，避免每个
+        # 候选文件的重复 stat 系统调用）
+        app_name_lower = app_name.lower()
+        case_insensitive_match = None
+        first_executable = None
+        with os.scandir(source_path) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                # 优先匹配与应用名完全一致的文件
+                if entry.name == app_name:
+                    return entry.name
+                # 再尝试大小写不敏感匹配
+                if case_insensitive_match is None and entry.name.lower() == app_name_lower:
+                    case_insensitive_match = entry.name
+                # 退化为第一个可执行文件
+                if first_executable is None and entry.stat().st_mode & 0o111:
+                    first_executable = entry.name
+
+        if case_insensitive_match:
+            return case_insensitive_match
+        if first_executable:
+            return first_executable
 
         # 最终兜底
         return app_name
 
-    def _create_control_file(self, debian_dir: Path, config: Dict[str, Any]):
+    def _create_control_file(
+        self, debian_dir: Path, config: Dict[str, Any], package_name: str
+    ):
         """
         创建DEBIAN/control文件.
         """
-        # DEB package name: prefer format-specific "package" field (must be ASCII for dpkg)
-        package_name = config.get("package", self.config.get("name", "myapp")).lower()
         version = self.config.get("version", "1.0.0")
         display_name = self.config.get("display_name", self.config.get("name", package_name))
 
         # 使用环境管理器获取标准化的架构信息
         arch = self.env_manager.get_arch_for_format("deb")
 
-        control_content = f"""Package: {package_name}
+        def _join(value) -> str:
+            return ", ".join(value) if isinstance(value, list) else str(value)
+
+        # 单次列表拼装 + 一次写入，避免逐段 str += 的二次拷贝
+        lines = [
+            f"""Package: {package_name}
 Version: {version}
 Section: {config.get('section', 'utils')}
 Priority: {config.get('priority', 'optional')}
@@ -164,50 +189,26 @@ Architecture: {arch}
 Maintainer: {config.get('maintainer', self.config.get('publisher', 'Unknown <unknown@example.com>'))}
 Description: {config.get('description', display_name)}
 """
-
-        # 添加依赖
-        depends = config.get("depends", [])
-        if depends:
-            if isinstance(depends, list):
-                depends_str = ", ".join(depends)
-            else:
-                depends_str = str(depends)
-            control_content += f"Depends: {depends_str}\n"
-
-        # 添加冲突
-        conflicts = config.get("conflicts", [])
-        if conflicts:
-            if isinstance(conflicts, list):
-                conflicts_str = ", ".join(conflicts)
-            else:
-                conflicts_str = str(conflicts)
-            control_content += f"Conflicts: {conflicts_str}\n"
-
-        # 添加推荐和建议
-        recommends = config.get("recommends", [])
-        if recommends:
-            if isinstance(recommends, list):
-                recommends_str = ", ".join(recommends)
-            else:
-                recommends_str = str(recommends)
-            control_content += f"Recommends: {recommends_str}\n"
-
-        suggests = config.get("suggests", [])
-        if suggests:
-            if isinstance(suggests, list):
-                suggests_str = ", ".join(suggests)
-            else:
-                suggests_str = str(suggests)
-            control_content += f"Suggests: {suggests_str}\n"
+        ]
+
+        # 添加依赖/冲突/推荐/建议
+        for field, key in (
+            ("Depends", "depends"),
+            ("Conflicts", "conflicts"),
+            ("Recommends", "recommends"),
+            ("Suggests", "suggests"),
+        ):
+            value = config.get(key, [])
+            if value:
+                lines.append(f"{field}: {_join(value)}\n")
 
         # 添加首页
         homepage = config.get("homepage")
         if homepage:
-            control_content += f"Homepage: {homepage}\n"
+            lines.append(f"Homepage: {homepage}\n")
 
-        # 写入控制文件
-        with open(debian_dir / "control", "w", encoding="utf-8") as f:
-            f.write(control_content)
+        # 写入控制文件（writev 单系统调用批量写出全部片段）
+        write_pieces(debian_dir / "control", lines)
 
     def _create_scripts(self, debian_dir: Path, config: Dict[str, Any]):
         """
@@ -219,26 +220,25 @@ Description: {config.get('description', display_name)}
             script_content = config.get(f"{script}_script")
             if script_content:
                 script_file = debian_dir / script
-                with open(script_file, "w", encoding="utf-8") as f:
-                    f.write("#!/bin/bash\n")
-                    f.write(script_content)
+                script_file.write_text(
+                    "#!/bin/bash\n" + script_content, encoding="utf-8"
+                )
                 script_file.chmod(0o755)
 
-    def _create_desktop_file(self, build_dir: Path, config: Dict[str, Any]):
+    def _create_desktop_file(
+        self, build_dir: Path, config: Dict[str, Any], package_name: str
+    ):
         """
         创建桌面文件.
         """
         if not config.get("create_desktop_file", True):
             return
 
-        # DEB package name: prefer format-specific "package" field (must be ASCII for dpkg)
-        package_name = config.get("package", self.config.get("name", "myapp")).lower()
         # Display name: can be non-ASCII, used in .desktop Name= field
         display_name = self.config.get("display_name", self.config.get("name", package_name))
 
-        # 创建applications目录
+        # applications 目录已在 package() 中批量创建
         apps_dir = build_dir / "usr" / "share" / "applications"
-        apps_dir.mkdir(parents=True)
 
         # 桌面文件内容
         desktop_content = f"""[Desktop Entry]
@@ -254,20 +254,18 @@ Terminal={str(config.get('terminal', False)).lower()}
 
         # 写入桌面文件
         desktop_file = apps_dir / f"{package_name}.desktop"
-        with open(desktop_file, "w", encoding="utf-8") as f:
-            f.write(desktop_content)
+        desktop_file.write_text(desktop_content, encoding="utf-8")
 
         # 复制图标文件
         icon_path = config.get("icon") or self.config.get("icon")
         if icon_path and os.path.exists(icon_path):
-            # 创建图标目录
+            # 图标目录已在 package() 中批量创建
             icon_dir = build_dir / "usr" / "share" / "pixmaps"
-            icon_dir.mkdir(parents=True)
 
             # 复制图标
             icon_ext = Path(icon_path).suffix
             icon_dest = icon_dir / f"{package_name}{icon_ext}"
-            shutil.copy2(icon_path, icon_dest)
+            fast_copyfile(str(icon_path), str(icon_dest))
 
     def _build_deb_package(self, build_dir: Path, output_path: Path) -> bool:
         """
@@ -277,10 +275,25 @@ Terminal={str(config.get('terminal', False)).lower()}
         self.ensure_output_dir(output_path)
 
         # 使用dpkg-deb构建包
-        command = ["dpkg-deb", "--build", str(build_dir), str(output_path)]
+        # --root-owner-group 直接规范文件属主，无需 fakeroot。
+        # data.tar 的 xz 压缩是 dpkg-deb 最耗时的一步：日常迭代构建
+        # （未设置 UNIFYPY_RELEASE）直接跳过压缩；发布构建用 zstd，
+        # 压缩率接近 xz 但速度快一个量级。
+        if os.environ.get("UNIFYPY_RELEASE"):
+            compress_args = ["-Zzstd", "-z3"]
+        else:
+            compress_args = ["-Znone"]
+        command = [
+            "dpkg-deb",
+            "--build",
+            "--root-owner-group",
+            *compress_args,
+            str(build_dir),
+            str(output_path),
+        ]
 
         success = self.runner.run_command(
-            command, "Linux DEB打包", "正在构建DEB包...", 80, shell=False
+            command, "Linux DEB打包", "正在构建DEB包...", 80
         )
 
         if success and output_path.exists():
@@ -309,11 +322,9 @@ Terminal={str(config.get('terminal', False)).lower()}
         if icon_path and not os.path.exists(icon_path):
             errors.append(f"图标文件不存在: {icon_path}")
 
-        # 检查dpkg-deb工具
+        # 检查dpkg-deb工具（which 结果进程内缓存）
         try:
-            import shutil
-
-            if not shutil.which("dpkg-deb"):
+            if not cached_which("dpkg-deb"):
                 errors.append(
                     "dpkg-deb工具未安装，请安装: sudo apt-get install dpkg-dev"
                 )
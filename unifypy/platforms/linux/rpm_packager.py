@@ -4,12 +4,14 @@
 Linux RPM 打包器 创建RedHat/CentOS/Fedora格式的安装包.
 """
 
+import datetime
 import os
-import shutil
 import tempfile
 from pathlib import Path
 from typing import Any, Dict, List
 
+from ...utils.command_runner import cached_which
+from ...utils.file_ops import fast_copyfile, write_pieces
 from ..base import BasePackager
 
 
@@ -59,94 +61,86 @@ class RPMPackager(BasePackager):
             for subdir in ["BUILD", "RPMS", "SOURCES", "SPECS", "SRPMS"]:
                 (rpmbuild_dir / subdir).mkdir(parents=True)
 
-            # 准备源文件
-            sources_dir = rpmbuild_dir / "SOURCES"
-            self._prepare_sources(source_path, sources_dir, rpm_config)
-
             # RPM package name: prefer format-specific "name" field (must be ASCII for rpmbuild)
+            # （派生名只在此处计算一次，传给各辅助方法）
             rpm_package_name = rpm_config.get("name", self.config.get("name", "myapp"))
 
+            # 准备附属源文件（图标等；应用本体不再打 tarball，
+            # 由 rpmbuild --build-in-place 直接消费 dist 目录）
+            sources_dir = rpmbuild_dir / "SOURCES"
+            self._prepare_sources(sources_dir, rpm_config)
+
+            # --build-in-place 要求从源目录内执行 rpmbuild；单文件模式
+            # 先在临时目录里组出只含该文件的目录（优先硬链接，零拷贝）
+            if source_path.is_file():
+                build_cwd = build_root / "dist"
+                build_cwd.mkdir()
+                staged_file = build_cwd / source_path.name
+                try:
+                    os.link(source_path, staged_file)
+                except OSError:
+                    fast_copyfile(str(source_path), str(staged_file))
+            else:
+                build_cwd = source_path
+
             # 创建spec文件
             spec_file = (
                 rpmbuild_dir / "SPECS" / f"{rpm_package_name}.spec"
             )
-            self._create_spec_file(spec_file, rpm_config, sources_dir)
+            self._create_spec_file(
+                spec_file, rpm_config, sources_dir, rpm_package_name
+            )
 
             # 构建RPM包
-            success = self._build_rpm_package(rpmbuild_dir, spec_file, output_path)
+            success = self._build_rpm_package(
+                rpmbuild_dir, spec_file, output_path, build_cwd
+            )
 
             return success
 
-    def _prepare_sources(
-        self, source_path: Path, sources_dir: Path, config: Dict[str, Any]
-    ):
+    def _prepare_sources(self, sources_dir: Path, config: Dict[str, Any]):
         """
-        准备源文件.
+        准备附属源文件（图标、额外源文件）.
         """
-        # RPM package name: prefer format-specific "name" field (must be ASCII for rpmbuild)
-        package_name = config.get("name", self.config.get("name", "myapp"))
-        # Global app name used by PyInstaller for the executable
-        global_name = self.config.get("name", "myapp")
-        version = self.config.get("version", "1.0.0")
-
-        # 创建源码目录
-        source_tarball = sources_dir / f"{package_name}-{version}.tar.gz"
+        # 收集所有待复制的 (源, 目标) 对，互相独立的 I/O 操作
+        # 超过一个时用线程池并发执行（sendfile 期间释放 GIL）
+        copies = []
 
-        # 创建临时目录用于打包
-        with tempfile.TemporaryDirectory() as temp_source_dir:
-            app_source_dir = Path(temp_source_dir) / f"{package_name}-{version}"
-            app_source_dir.mkdir()
-
-            if source_path.is_file():
-                # 单个可执行文件
-                shutil.copy2(source_path, app_source_dir / source_path.name)
-                (app_source_dir / source_path.name).chmod(0o755)
-            else:
-                # 目录 - 复制所有内容，并确保主可执行文件存在
-                main_executable = None
-                for item in source_path.iterdir():
-                    if item.is_file():
-                        shutil.copy2(item, app_source_dir / item.name)
-                        # 查找主可执行文件（使用全局名称匹配，因为 PyInstaller 用全局名构建）
-                        if item.name == global_name or item.stem == global_name:
-                            main_executable = app_source_dir / item.name
-                            main_executable.chmod(0o755)
-                    else:
-                        shutil.copytree(item, app_source_dir / item.name)
-
-                # 如果没有找到主可执行文件，查找第一个可执行文件
-                if not main_executable:
-                    for item in (app_source_dir).iterdir():
-                        if item.is_file() and os.access(item, os.X_OK):
-                            main_executable = item
-                            break
-
-            # 创建tar.gz文件
-            import tarfile
-
-            with tarfile.open(source_tarball, "w:gz") as tar:
-                tar.add(app_source_dir, arcname=f"{package_name}-{version}")
-
-        # 复制图标文件到 SOURCES 目录（作为 Source1）
+        # 图标文件复制到 SOURCES 目录（作为 Source1）
         icon_path = config.get("icon") or self.config.get("icon")
         if icon_path and os.path.exists(icon_path):
             icon_filename = Path(icon_path).name
-            shutil.copy2(icon_path, sources_dir / icon_filename)
+            copies.append((str(icon_path), str(sources_dir / icon_filename)))
 
-        # 复制其他源文件
+        # 其他源文件
         extra_sources = config.get("extra_sources", [])
         for extra_source in extra_sources:
             if os.path.exists(extra_source):
-                shutil.copy2(extra_source, sources_dir)
+                dest = sources_dir / Path(extra_source).name
+                copies.append((str(extra_source), str(dest)))
+
+        if len(copies) > 1:
+            import concurrent.futures
+
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, len(copies))
+            ) as executor:
+                # list() 物化结果，第一个异常在此抛出
+                list(executor.map(lambda pair: fast_copyfile(*pair), copies))
+        else:
+            for src, dst in copies:
+                fast_copyfile(src, dst)
 
     def _create_spec_file(
-        self, spec_file: Path, config: Dict[str, Any], sources_dir: Path
+        self,
+        spec_file: Path,
+        config: Dict[str, Any],
+        sources_dir: Path,
+        app_name: str,
     ):
         """
         创建RPM spec文件.
         """
-        # RPM package name: prefer format-specific "name" field (must be ASCII for rpmbuild)
-        app_name = config.get("name", self.config.get("name", "myapp"))
         # Global app name used by PyInstaller for the executable
         global_name = self.config.get("name", "myapp")
         version = self.config.get("version", "1.0.0")
@@ -155,13 +149,22 @@ class RPMPackager(BasePackager):
         # 使用环境管理器获取标准化的架构信息
         arch = self.env_manager.get_arch_for_format("rpm")
 
-        # 检查是否有图标文件
+        # 检查是否有图标文件（文件名/扩展名派生值只算一次，下面
+        # Source1、%install 和 %files 三处复用）
         icon_path = config.get("icon") or self.config.get("icon")
         has_icon = icon_path and os.path.exists(icon_path)
+        if has_icon:
+            icon_file = Path(icon_path)
+            icon_filename = icon_file.name
+            icon_ext = icon_file.suffix
 
-        # 构建 spec 文件头部
-        spec_content = f"""# 防御性定义 dist 宏（兼容老版本 RHEL）
+        # 逐段收集、末尾一次 join 写入，避免长 spec 的 str += 二次拷贝
+        parts = [f"""# 防御性定义 dist 宏（兼容老版本 RHEL）
 %{{!?dist: %{{define dist .el}}}}
+# PyInstaller 产物已经 strip 过且多为非 ELF 数据文件，
+# find-debuginfo/brp-strip 等安装后处理只会白白扫一遍 payload
+%global debug_package %{{nil}}
+%global __os_install_post %{{nil}}
 
 Name:           {app_name}
 Version:        {version}
@@ -170,37 +173,32 @@ Summary:        {config.get('summary', self.config.get('display_name', app_name)
 
 License:        {config.get('license', 'Unknown')}
 URL:            {config.get('url', '')}
-Source0:        %{{name}}-%{{version}}.tar.gz
-"""
+"""]
 
         # 如果有图标，添加 Source1
         if has_icon:
-            icon_filename = Path(icon_path).name
-            spec_content += f"Source1:        {icon_filename}\n"
+            parts.append(f"Source1:        {icon_filename}\n")
 
-        spec_content += f"""
+        parts.append(f"""
 BuildArch:      {arch}
-"""
+""")
 
         # 添加依赖
         requires = config.get("requires", [])
         if requires:
             for req in requires:
-                spec_content += f"Requires:       {req}\n"
+                parts.append(f"Requires:       {req}\n")
 
         build_requires = config.get("build_requires", [])
         if build_requires:
             for req in build_requires:
-                spec_content += f"BuildRequires:  {req}\n"
+                parts.append(f"BuildRequires:  {req}\n")
 
         # 描述部分
-        spec_content += f"""
+        parts.append(f"""
 %description
 {config.get('description', self.config.get('display_name', app_name))}
 
-%prep
-%setup -q
-
 %build
 # 不需要编译步骤，因为我们使用的是预编译的二进制文件
 
@@ -208,10 +206,10 @@ BuildArch:      {arch}
 rm -rf $RPM_BUILD_ROOT
 mkdir -p $RPM_BUILD_ROOT/opt/{app_name}
 mkdir -p $RPM_BUILD_ROOT/usr/local/bin
-"""
+""")
 
         # 安装文件
-        spec_content += f"""
+        parts.append(f"""
 # 复制应用文件
 cp -a . $RPM_BUILD_ROOT/opt/{app_name}/
 
@@ -228,11 +226,11 @@ cd "$SCRIPT_DIR" || exit 1
 exec "$SCRIPT_DIR/{global_name}" "$@"
 LAUNCHER_EOF
 chmod +x $RPM_BUILD_ROOT/usr/local/bin/{app_name}
-"""
+""")
 
         # 桌面文件
         if config.get("create_desktop_file", True):
-            spec_content += f"""
+            parts.append(f"""
 # 创建桌面文件
 mkdir -p $RPM_BUILD_ROOT/usr/share/applications
 cat > $RPM_BUILD_ROOT/usr/share/applications/{app_name}.desktop << 'EOF'
@@ -246,59 +244,54 @@ Comment={config.get('description', self.config.get('display_name', app_name))}
 Categories={config.get('categories', 'Utility;')}
 Terminal={str(config.get('terminal', False)).lower()}
 EOF
-"""
+""")
 
-        # 图标文件
-        icon_path = config.get("icon") or self.config.get("icon")
-        if icon_path and os.path.exists(icon_path):
-            icon_ext = Path(icon_path).suffix
-            spec_content += f"""
+        # 图标文件（复用前面 has_icon 的检查结果，避免重复 stat）
+        if has_icon:
+            parts.append(f"""
 # 复制图标文件
 mkdir -p $RPM_BUILD_ROOT/usr/share/pixmaps
 cp %{{SOURCE1}} $RPM_BUILD_ROOT/usr/share/pixmaps/{app_name}{icon_ext}
-"""
+""")
 
         # 文件列表
-        spec_content += f"""
+        parts.append(f"""
 %files
 %defattr(-,root,root,-)
 /opt/{app_name}/*
 /usr/local/bin/{app_name}
-"""
+""")
 
         if config.get("create_desktop_file", True):
-            spec_content += f"/usr/share/applications/{app_name}.desktop\n"
+            parts.append(f"/usr/share/applications/{app_name}.desktop\n")
 
-        if icon_path and os.path.exists(icon_path):
-            icon_ext = Path(icon_path).suffix
-            spec_content += f"/usr/share/pixmaps/{app_name}{icon_ext}\n"
+        if has_icon:
+            parts.append(f"/usr/share/pixmaps/{app_name}{icon_ext}\n")
 
         # 脚本部分
         scripts = ["pre", "post", "preun", "postun"]
         for script in scripts:
             script_content = config.get(f"{script}_script")
             if script_content:
-                spec_content += f"""
+                parts.append(f"""
 %{script}
 {script_content}
-"""
+""")
 
         # 变更日志
-        spec_content += f"""
+        parts.append(f"""
 %changelog
 * {self._get_current_date()} {config.get('packager', 'Unknown <unknown@example.com>')} - {version}-{release}
 - Initial package
-"""
+""")
 
-        # 写入spec文件
-        with open(spec_file, "w", encoding="utf-8") as f:
-            f.write(spec_content)
+        # 写入spec文件（writev 单系统调用批量写出全部片段）
+        write_pieces(spec_file, parts)
 
     def _get_current_date(self) -> str:
         """
         获取当前日期（RPM格式）
         """
-        import datetime
         import locale
 
         try:
@@ -310,36 +303,64 @@ cp %{{SOURCE1}} $RPM_BUILD_ROOT/usr/share/pixmaps/{app_name}{icon_ext}
         return datetime.datetime.now().strftime("%a %b %d %Y")
 
     def _build_rpm_package(
-        self, rpmbuild_dir: Path, spec_file: Path, output_path: Path
+        self,
+        rpmbuild_dir: Path,
+        spec_file: Path,
+        output_path: Path,
+        build_cwd: Path,
     ) -> bool:
         """
-        构建RPM包.
+        构建RPM包（rpmbuild ≥ 4.13，需要 --build-in-place 支持）.
         """
         # 设置环境变量
         env = os.environ.copy()
         env["HOME"] = str(rpmbuild_dir.parent)
 
-        # 构建命令
+        # 构建命令：-bb 只产二进制包；payload 压缩是 rpmbuild 的大头，
+        # 日常构建（未设置 UNIFYPY_RELEASE）直接关掉，发布构建用 zstd
+        if os.environ.get("UNIFYPY_RELEASE"):
+            payload = "w2.zstdio"
+        else:
+            payload = "w.ufdio"
         command = [
             "rpmbuild",
             "--define",
             f"_topdir {rpmbuild_dir}",
+            "--define",
+            f"_binary_payload {payload}",
+            "--define",
+            "debug_package %{nil}",
             "-bb",
+            "--build-in-place",
             str(spec_file),
         ]
 
+        # --build-in-place 跳过 SOURCES tarball 和 %prep 解包，
+        # %install 直接在 dist 目录内执行 cp -a，省去两轮完整读写
         success = self.runner.run_command(
-            command, "Linux RPM打包", "正在构建RPM包...", 80, shell=False
+            command,
+            "Linux RPM打包",
+            "正在构建RPM包...",
+            80,
+            cwd=str(build_cwd),
         )
 
         if success:
-            # 查找生成的RPM文件
+            # 查找生成的RPM文件（scandir 后缀过滤，免去 rglob 的
+            # fnmatch 匹配和完整列表物化）
             rpms_dir = rpmbuild_dir / "RPMS"
-            rpm_files = list(rpms_dir.rglob("*.rpm"))
-
-            if rpm_files:
-                # 复制到输出位置
-                shutil.copy2(rpm_files[0], output_path)
+            rpm_file = None
+            for dirpath, _dirnames, filenames in os.walk(rpms_dir):
+                for filename in filenames:
+                    if filename.endswith(".rpm"):
+                        rpm_file = Path(dirpath) / filename
+                        break
+                if rpm_file:
+                    break
+
+            if rpm_file:
+                # 复制到输出位置（RPM 可达数百 MB，走零拷贝路径）
+                fast_copyfile(str(rpm_file), str(output_path))
                 return True
             else:
                 self.progress.on_error(
@@ -368,11 +389,9 @@ cp %{{SOURCE1}} $RPM_BUILD_ROOT/usr/share/pixmaps/{app_name}{icon_ext}
         if icon_path and not os.path.exists(icon_path):
             errors.append(f"图标文件不存在: {icon_path}")
 
-        # 检查rpmbuild工具
+        # 检查rpmbuild工具（which 结果进程内缓存）
         try:
-            import shutil
-
-            if not shutil.which("rpmbuild"):
+            if not cached_which("rpmbuild"):
                 errors.append(
                     "rpmbuild工具未安装，请安装: sudo yum install rpm-build 或 sudo dnf install rpm-build, debian系列 sudo apt install rpm"
                 )
@@ -78,7 +78,7 @@ class DMGPackager(BasePackager):
 
         # 执行命令
         success = self.runner.run_command(
-            command, "macOS DMG打包", "正在创建DMG安装包...", 80, shell=False
+            command, "macOS DMG打包", "正在创建DMG安装包...", 80
         )
 
         if success and output_path.exists():
@@ -146,8 +146,11 @@ class DMGPackager(BasePackager):
                     ["--icon", app_path.name, str(icon_pos[0]), str(icon_pos[1])]
                 )
 
-        # 格式选项
-        dmg_format = config.get("format", "UDZO")  # UDZO是默认压缩格式
+        # 格式选项：hdiutil 的 UDZO(zlib) 压缩是单线程的，往往是
+        # DMG 构建的最长一步；ULFO(LZFSE) 多线程压缩且压缩率相近。
+        # 发布构建（UNIFYPY_RELEASE）保持 UDZO 以兼容老系统挂载。
+        default_format = "UDZO" if os.environ.get("UNIFYPY_RELEASE") else "ULFO"
+        dmg_format = config.get("format", default_format)
         command.extend(["--format", dmg_format])
 
         # 文件系统
@@ -257,18 +257,22 @@ class MacOSPostProcessor:
         print("\n🔍 PyInstaller 命令调试:")
         print(f"完整命令: {' '.join(command)}")
 
-        # 检查关键参数
-        if "--osx-bundle-identifier" in command:
-            idx = command.index("--osx-bundle-identifier")
-            if idx + 1 < len(command):
-                print(f"  Bundle ID: {command[idx + 1]}")
-
-        if "--osx-entitlements-file" in command:
-            idx = command.index("--osx-entitlements-file")
-            if idx + 1 < len(command):
-                entitlements_path = command[idx + 1]
-                print(f"  Entitlements: {entitlements_path}")
-                print(f"  文件存在: {Path(entitlements_path).exists()}")
+        # 检查关键参数：一次线性扫描建 "--flag -> 值" 映射，
+        # 替代逐个 `in` + `index` 的重复 O(N) 查找
+        argmap = {
+            arg: command[i + 1]
+            for i, arg in enumerate(command[:-1])
+            if arg.startswith("--")
+        }
+
+        bundle_id = argmap.get("--osx-bundle-identifier")
+        if bundle_id is not None:
+            print(f"  Bundle ID: {bundle_id}")
+
+        entitlements_path = argmap.get("--osx-entitlements-file")
+        if entitlements_path is not None:
+            print(f"  Entitlements: {entitlements_path}")
+            print(f"  文件存在: {Path(entitlements_path).exists()}")
 
         print()
 
@@ -353,9 +357,14 @@ class MacOSPostProcessor:
             import subprocess
             import locale
 
-            # 验证签名
+            # 一次调用同时完成签名验证和 entitlements 读取：
+            # 详细签名信息走 stderr，entitlements（:-）走 stdout，
+            # 省掉第二次 fork/exec
             result = subprocess.run(
-                ['codesign', '-dv', '--verbose=4', str(app_path)],
+                [
+                    'codesign', '-dv', '--verbose=4',
+                    '--entitlements', ':-', str(app_path),
+                ],
                 capture_output=True,
                 text=True,
                 encoding=locale.getpreferredencoding(False) or 'utf-8',
@@ -368,26 +377,18 @@ class MacOSPostProcessor:
                 print(f"  ⚠️ 代码签名验证失败: {result.stderr}")
                 return False
 
-            # 检查 entitlements
-            entitlements_result = subprocess.run(
-                ['codesign', '-d', '--entitlements', ':-', str(app_path)],
-                capture_output=True,
-                text=True,
-                encoding=locale.getpreferredencoding(False) or 'utf-8',
-                errors='replace',
-            )
-
-            if entitlements_result.returncode == 0 and entitlements_result.stdout:
+            # 检查 entitlements（同一次调用的 stdout）
+            if result.stdout:
                 print("  ✅ Entitlements 已应用")
                 if self.verbose:
                     # 显示 entitlements 内容摘要
-                    if 'com.apple.security.device.microphone' in entitlements_result.stdout:
+                    if 'com.apple.security.device.microphone' in result.stdout:
                         print("    • 麦克风权限")
-                    if 'com.apple.security.device.camera' in entitlements_result.stdout:
+                    if 'com.apple.security.device.camera' in result.stdout:
                         print("    • 摄像头权限")
-                    if 'com.apple.security.files.user-selected.read-write' in entitlements_result.stdout:
+                    if 'com.apple.security.files.user-selected.read-write' in result.stdout:
                         print("    • 文件访问权限")
-                    if 'com.apple.security.network.client' in entitlements_result.stdout:
+                    if 'com.apple.security.network.client' in result.stdout:
                         print("    • 网络客户端权限")
             else:
                 print("  ⚠️ 未检测到 entitlements")
@@ -4,10 +4,29 @@
 打包器注册表 支持动态添加新的打包格式.
 """
 
-from typing import Dict, List, Optional, Type
+import functools
+import importlib
+from typing import Dict, List, Optional, Tuple, Type
 
 from .base import BasePackager
 
+# 默认打包器的延迟导入表：platform -> {format: (模块名, 类名)}。
+# 构造注册表时不导入任何平台模块，首次 get_packager 时才导入
+# 对应格式的打包器——Linux 构建无需付出 Inno/DMG 辅助链的导入开销
+_DEFAULT_PACKAGERS: Dict[str, Dict[str, Tuple[str, str]]] = {
+    "windows": {
+        "exe": ("unifypy.platforms.windows.inno_setup", "InnoSetupPackager"),
+    },
+    "macos": {
+        "dmg": ("unifypy.platforms.macos.dmg_packager", "DMGPackager"),
+    },
+    "linux": {
+        "appimage": ("unifypy.platforms.linux.appimage_packager", "AppImagePackager"),
+        "deb": ("unifypy.platforms.linux.deb_packager", "DEBPackager"),
+        "rpm": ("unifypy.platforms.linux.rpm_packager", "RPMPackager"),
+    },
+}
+
 
 class PackagerRegistry:
     """
@@ -19,35 +38,13 @@ class PackagerRegistry:
         初始化注册表.
         """
         self._packagers: Dict[str, Dict[str, Type[BasePackager]]] = {}
-        self._load_default_packagers()
-
-    def _load_default_packagers(self):
-        """
-        加载默认打包器.
-        """
-        try:
-            # Windows 打包器
-            from .windows.inno_setup import InnoSetupPackager
-
-            self.register_packager("windows", "exe", InnoSetupPackager)
-
-            # macOS 打包器
-            from .macos.dmg_packager import DMGPackager
-
-            self.register_packager("macos", "dmg", DMGPackager)
-
-            # Linux 打包器
-            from .linux.appimage_packager import AppImagePackager
-            from .linux.deb_packager import DEBPackager
-            from .linux.rpm_packager import RPMPackager
-
-            self.register_packager("linux", "appimage", AppImagePackager)
-            self.register_packager("linux", "deb", DEBPackager)
-            self.register_packager("linux", "rpm", RPMPackager)
-
-        except ImportError:
-            # 如果某些平台的打包器模块不存在，忽略错误
-            pass
+        # 延迟注册表：已解析的类会迁移到 _packagers 缓存
+        self._lazy: Dict[str, Dict[str, Tuple[str, str]]] = {
+            platform: dict(formats)
+            for platform, formats in _DEFAULT_PACKAGERS.items()
+        }
+        # supported_formats 的 frozenset 缓存，register_packager 时失效
+        self._format_cache: Dict[str, frozenset] = {}
 
     def register_packager(
         self, platform: str, format_type: str, packager_class: Type[BasePackager]
@@ -63,11 +60,12 @@ class PackagerRegistry:
             self._packagers[platform] = {}
 
         self._packagers[platform][format_type] = packager_class
+        self._format_cache.pop(platform, None)
 
     def get_packager(
         self, platform: str, format_type: str
     ) -> Optional[Type[BasePackager]]:
-        """获取指定格式的打包器类.
+        """获取指定格式的打包器类（按需导入模块）.
 
         Args:
             platform: 平台名称
@@ -76,7 +74,44 @@ class PackagerRegistry:
         Returns:
             Optional[Type[BasePackager]]: 打包器类，如果不存在则返回None
         """
-        return self._packagers.get(platform, {}).get(format_type)
+        packager_class = self._packagers.get(platform, {}).get(format_type)
+        if packager_class is not None:
+            return packager_class
+
+        spec = self._lazy.get(platform, {}).get(format_type)
+        if spec is None:
+            return None
+
+        module_name, class_name = spec
+        try:
+            module = importlib.import_module(module_name)
+            packager_class = getattr(module, class_name)
+        except ImportError:
+            # 某些平台的打包器模块不存在时忽略
+            return None
+
+        self.register_packager(platform, format_type, packager_class)
+        return packager_class
+
+    def supported_formats(self, platform: str) -> frozenset:
+        """获取平台支持格式的集合（按平台缓存）.
+
+        调用方用它做 O(1) 成员判断，避免逐 key 调
+        is_format_supported 的重复字典查找。
+
+        Args:
+            platform: 平台名称
+
+        Returns:
+            frozenset: 支持的格式集合
+        """
+        cached = self._format_cache.get(platform)
+        if cached is None:
+            cached = frozenset(self._lazy.get(platform, {})) | frozenset(
+                self._packagers.get(platform, {})
+            )
+            self._format_cache[platform] = cached
+        return cached
 
     def get_supported_formats(self, platform: str) -> List[str]:
         """获取平台支持的所有格式.
@@ -87,7 +122,7 @@ class PackagerRegistry:
         Returns:
             List[str]: 支持的格式列表
         """
-        return list(self._packagers.get(platform, {}).keys())
+        return sorted(self.supported_formats(platform))
 
     def get_all_platforms(self) -> List[str]:
         """获取所有支持的平台.
@@ -95,7 +130,9 @@ class PackagerRegistry:
         Returns:
             List[str]: 平台列表
         """
-        return list(self._packagers.keys())
+        platforms = dict(self._lazy)
+        platforms.update(self._packagers)
+        return list(platforms.keys())
 
     def is_format_supported(self, platform: str, format_type: str) -> bool:
         """检查格式是否支持.
@@ -107,4 +144,16 @@ class PackagerRegistry:
         Returns:
             bool: 是否支持
         """
-        return format_type in self._packagers.get(platform, {})
+        return format_type in self._packagers.get(
+            platform, {}
+        ) or format_type in self._lazy.get(platform, {})
+
+
+@functools.lru_cache(maxsize=1)
+def default_registry() -> PackagerRegistry:
+    """进程级共享的默认打包器注册表.
+
+    Returns:
+        PackagerRegistry: 共享的注册表实例
+    """
+    return PackagerRegistry()
@@ -4,13 +4,36 @@
 Windows Inno Setup 打包器 支持完整的Inno Setup脚本配置.
 """
 
+import glob
 import os
+import re
 import tempfile
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from ...utils.command_runner import cached_which
 from ..base import BasePackager
 
+# 进程级缓存：ISCC 路径在一次构建内不会变化，validate_config 和
+# package() 各自触发的注册表/文件系统探测只需要做一次
+_compiler_path_cache: Optional[str] = None
+
+# 从安装目录名提取 Inno Setup 主版本号（用于多版本排序）
+_INNO_VERSION_RE = re.compile(r"Inno Setup (\d+)")
+
+# 模板清理用的预编译正则（每次构建复用，避免重复编译）
+_TEMPLATE_TAG_RE = re.compile(r"\{\{[#/][^}]+\}\}")
+# 模板变量 {{NAME}}（单趟 sub 完成全部替换，替代逐变量 str.replace）
+_VAR_RE = re.compile(r"\{\{(\w+)\}\}")
+_EXTRA_BLANK_LINES_RE = re.compile(r"\n\s*\n\s*\n")
+
+# Inno Setup 语言名 -> MessagesFile 路径（查表替代逐语言 if 链）
+_ISS_LANG_TABLE = {
+    "english": "compiler:Default.isl",
+    "chinesesimplified": "compiler:Languages\\ChineseSimplified.isl",
+    "chinese": "compiler:Languages\\ChineseSimplified.isl",
+}
+
 
 class InnoSetupPackager(BasePackager):
     """
@@ -120,15 +143,22 @@ class InnoSetupPackager(BasePackager):
                 # 重新加载配置以包含新的 AppID
                 import json
                 try:
-                    with open(self.config_file_path, "r", encoding="utf-8") as f:
-                        updated_config = json.load(f)
+                    # 二进制读 + json.loads（容忍 BOM），省一次文本解码
+                    with open(self.config_file_path, "rb") as f:
+                        raw = f.read()
+                    if raw.startswith(b"\xef\xbb\xbf"):
+                        raw = raw[3:]
+                    updated_config = json.loads(raw)
                     self.config = updated_config
                     inno_config = self.get_format_config("inno_setup")
                 except Exception as e:
                     self.progress.warning(f"重新加载配置失败: {e}")
 
-        # 创建 ISS 脚本
-        iss_content = self._build_iss_script(inno_config, source_path, output_path)
+        # 创建 ISS 脚本（渲染结果按输入 hash 缓存，模板/配置/路径
+        # 未变化的迭代构建直接复用上次渲染的脚本文件）
+        iss_file, iss_is_cached = self._render_iss_cached(
+            inno_config, source_path, output_path
+        )
 
         # 更新配置 hash（用于后续变化检测）
         self.cache_manager.save_config_hash(
@@ -136,19 +166,12 @@ class InnoSetupPackager(BasePackager):
             "windows"
         )
 
-        # 写入临时ISS文件 - 使用UTF-8 BOM编码确保中文字符正确显示
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".iss", delete=False, encoding="utf-8-sig"
-        ) as f:
-            f.write(iss_content)
-            iss_file = f.name
-
         try:
             # 执行编译
             command = [compiler_path, "/Q", iss_file]
 
             success = self.runner.run_command(
-                command, "Windows打包", "正在生成Windows安装程序...", 80, shell=False
+                command, "Windows打包", "正在生成Windows安装程序...", 80
             )
 
             if success:
@@ -164,30 +187,91 @@ class InnoSetupPackager(BasePackager):
                 return False
 
         finally:
-            # 清理临时文件
-            try:
-                os.unlink(iss_file)
-            except OSError:
-                pass
+            # 清理临时文件（缓存文件保留给下次构建复用）
+            if not iss_is_cached:
+                try:
+                    os.unlink(iss_file)
+                except OSError:
+                    pass
+
+    def _render_iss_cached(self, inno_config, source_path: Path, output_path: Path):
+        """渲染 ISS 脚本，输入未变化时复用缓存结果.
+
+        hash 因子包括模板文件的 mtime/size、打包器完整配置以及
+        源/输出路径；命中 .unifypy/cache 下的缓存文件时跳过模板
+        读取与渲染。无缓存管理器时退化为一次性临时文件。
+
+        Args:
+            inno_config: Inno Setup 格式配置
+            source_path: 源文件路径
+            output_path: 输出安装包路径
+
+        Returns:
+            tuple: (ISS 文件路径, 是否为缓存文件)
+        """
+        cache_dir = None
+        if getattr(self, "cache_manager", None):
+            cache_dir = self.cache_manager.cache_dir
+
+        if cache_dir is not None:
+            import hashlib
+            import json as _json
+
+            factors = {
+                "config": self.config,
+                "inno_config": inno_config,
+                "source": str(source_path),
+                "output": str(output_path),
+            }
+            template_path = self._find_iss_template()
+            if template_path:
+                st = os.stat(template_path)
+                factors["template"] = [str(template_path), st.st_mtime_ns, st.st_size]
+            digest = hashlib.sha256(
+                _json.dumps(factors, sort_keys=True, default=str).encode("utf-8")
+            ).hexdigest()[:16]
+
+            cached_file = cache_dir / f"setup_{digest}.iss"
+            if cached_file.exists():
+                return str(cached_file), True
+
+            iss_content = self._build_iss_script(inno_config, source_path, output_path)
+            # UTF-8 BOM 编码确保中文字符在 Inno Setup 中正确显示
+            with open(cached_file, "w", encoding="utf-8-sig") as f:
+                f.write(iss_content)
+            return str(cached_file), True
+
+        iss_content = self._build_iss_script(inno_config, source_path, output_path)
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".iss", delete=False, encoding="utf-8-sig"
+        ) as f:
+            f.write(iss_content)
+            return f.name, False
 
     def _find_inno_setup_compiler(self) -> str:
         """
-        查找Inno Setup编译器.
+        查找Inno Setup编译器（注册表/文件系统探测结果进程内缓存）.
         """
-        # 首先检查配置中的路径
+        global _compiler_path_cache
+
+        # 首先检查配置中的路径（依赖实例配置，不进缓存）
         inno_path = self.config.get("inno_setup_path")
         if inno_path and os.path.exists(inno_path):
             if hasattr(self, "progress"):
                 self.progress.info(f"✅ 使用配置中的 Inno Setup 路径: {inno_path}")
             return inno_path
 
-        # 检查PATH环境变量
+        # 命中缓存前先确认路径仍然有效
+        if _compiler_path_cache and os.path.exists(_compiler_path_cache):
+            return _compiler_path_cache
+
+        # 检查PATH环境变量（which 结果进程内缓存）
         try:
-            import shutil
-            path_found = shutil.which("ISCC.exe")
+            path_found = cached_which("ISCC.exe")
             if path_found:
                 if hasattr(self, "progress"):
                     self.progress.info(f"✅ 在PATH中找到 Inno Setup: {path_found}")
+                _compiler_path_cache = path_found
                 return path_found
         except Exception:
             pass
@@ -197,6 +281,7 @@ class InnoSetupPackager(BasePackager):
         if detected_path:
             if hasattr(self, "progress"):
                 self.progress.info(f"✅ 自动检测到 Inno Setup: {detected_path}")
+            _compiler_path_cache = detected_path
             return detected_path
 
         return None
@@ -210,22 +295,21 @@ class InnoSetupPackager(BasePackager):
         if registry_path and os.path.exists(registry_path):
             return registry_path
 
-        # 检查常见安装路径（按版本从新到旧）
-        common_paths = [
-            r"C:\Program Files (x86)\Inno Setup 6\ISCC.exe",
-            r"C:\Program Files\Inno Setup 6\ISCC.exe",
-            r"C:\Program Files (x86)\Inno Setup 5\ISCC.exe",
-            r"C:\Program Files\Inno Setup 5\ISCC.exe",
-        ]
-
+        # 检查常见安装路径：一次 glob 扫描覆盖两个 Program Files 和
+        # 所有已安装版本，免去逐版本硬编码的 stat 级联
         if hasattr(self, "progress"):
             self.progress.info("🔍 搜索 Inno Setup 安装路径...")
 
-        for path in common_paths:
-            if os.path.exists(path):
-                # 检查并设置语言文件
-                self._setup_language_files(os.path.dirname(path))
-                return path
+        candidates = glob.glob(r"C:\Program Files*\Inno Setup*\ISCC.exe")
+
+        def _version_key(path: str) -> int:
+            match = _INNO_VERSION_RE.search(path)
+            return int(match.group(1)) if match else 0
+
+        for path in sorted(candidates, key=_version_key, reverse=True):
+            # 检查并设置语言文件
+            self._setup_language_files(os.path.dirname(path))
+            return path
 
         if hasattr(self, "progress"):
             self.progress.warning("⚠️ 未找到 Inno Setup 安装，请手动安装或在配置中指定路径")
@@ -239,29 +323,48 @@ class InnoSetupPackager(BasePackager):
         try:
             import winreg
 
-            # 检查不同版本的注册表项
-            registry_keys = [
-                r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall\Inno Setup 6_is1",
-                r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall\Inno Setup 5_is1",
-                r"SOFTWARE\Wow6432Node\Microsoft\Windows\CurrentVersion\Uninstall\Inno Setup 6_is1",
-                r"SOFTWARE\Wow6432Node\Microsoft\Windows\CurrentVersion\Uninstall\Inno Setup 5_is1",
+            # 枚举 Uninstall 键、按前缀过滤：一次遍历覆盖所有
+            # Inno Setup 版本（5/6/未来版本），替代逐版本 OpenKey 探测
+            uninstall_roots = [
+                r"SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall",
+                r"SOFTWARE\Wow6432Node\Microsoft\Windows\CurrentVersion\Uninstall",
             ]
 
-            for key_path in registry_keys:
+            candidates = []
+            for root_path in uninstall_roots:
                 try:
-                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, key_path) as key:
-                        install_location, _ = winreg.QueryValueEx(
-                            key, "InstallLocation"
-                        )
-                        if install_location:
-                            iscc_path = os.path.join(install_location, "ISCC.exe")
-                            if os.path.exists(iscc_path):
-                                # 设置语言文件
-                                self._setup_language_files(install_location)
-                                return iscc_path
+                    with winreg.OpenKey(
+                        winreg.HKEY_LOCAL_MACHINE, root_path
+                    ) as root:
+                        subkey_count = winreg.QueryInfoKey(root)[0]
+                        for index in range(subkey_count):
+                            subkey_name = winreg.EnumKey(root, index)
+                            if not subkey_name.startswith("Inno Setup"):
+                                continue
+                            try:
+                                with winreg.OpenKey(root, subkey_name) as key:
+                                    install_location, _ = winreg.QueryValueEx(
+                                        key, "InstallLocation"
+                                    )
+                                if install_location:
+                                    candidates.append(
+                                        (subkey_name, install_location)
+                                    )
+                            except (FileNotFoundError, OSError):
+                                continue
                 except (FileNotFoundError, OSError):
                     continue
 
+            # 版本号在键名里（"Inno Setup 6_is1"），倒序优先取新版本
+            for _subkey_name, install_location in sorted(
+                candidates, reverse=True
+            ):
+                iscc_path = os.path.join(install_location, "ISCC.exe")
+                if os.path.exists(iscc_path):
+                    # 设置语言文件
+                    self._setup_language_files(install_location)
+                    return iscc_path
+
         except ImportError:
             # winreg模块不可用（非Windows系统）
             pass
@@ -315,14 +418,13 @@ class InnoSetupPackager(BasePackager):
                     self.progress.info(f"从 {url} 下载...")
                     urllib.request.urlretrieve(url, target_path)
 
-                    # 验证文件
-                    if (
-                        os.path.exists(target_path)
-                        and os.path.getsize(target_path) > 100
-                    ):
-                        return True
-                    else:
-                        os.remove(target_path) if os.path.exists(target_path) else None
+                    # 验证文件（单次 stat 拿到存在性和大小）
+                    try:
+                        if os.stat(target_path).st_size > 100:
+                            return True
+                        os.remove(target_path)
+                    except OSError:
+                        pass
 
                 except Exception as e:
                     self.progress.warning(f"从 {url} 下载失败: {e}")
@@ -450,18 +552,18 @@ class InnoSetupPackager(BasePackager):
         with open(template_path, 'r', encoding='utf-8') as f:
             template_content = f.read()
 
-        # 替换模板变量
+        # 模板变量表（变量名 -> 替换值，单趟正则完成全部替换）
         replacements = {
-            '{{APP_ID}}': app_id,
-            '{{APP_NAME}}': app_name,
-            '{{APP_VERSION}}': app_version,
-            '{{APP_DISPLAY_NAME}}': display_name,
-            '{{APP_PUBLISHER}}': publisher,
-            '{{APP_URL}}': app_url,
-            '{{OUTPUT_DIR}}': str(output_path.parent).replace('/', '\\'),
-            '{{OUTPUT_FILENAME}}': output_path.stem,
-            '{{SOURCE_FILES}}': source_files,
-            '{{EXE_NAME}}': exe_name,
+            'APP_ID': app_id,
+            'APP_NAME': app_name,
+            'APP_VERSION': app_version,
+            'APP_DISPLAY_NAME': display_name,
+            'APP_PUBLISHER': publisher,
+            'APP_URL': app_url,
+            'OUTPUT_DIR': str(output_path.parent).replace('/', '\\'),
+            'OUTPUT_FILENAME': output_path.stem,
+            'SOURCE_FILES': source_files,
+            'EXE_NAME': exe_name,
         }
 
         # 条件块处理
@@ -498,33 +600,31 @@ class InnoSetupPackager(BasePackager):
                     result = result[:start_idx] + result[end_idx + len(end_tag):]
                     start_idx = result.find(start_tag, start_idx)
 
-        # 处理特殊替换
-        if conditions['{{#LICENSE_FILE}}']:
-            result = result.replace('{{LICENSE_FILE}}', str(Path(config.get('license_file')).resolve()).replace('/', '\\'))
-        
-        if conditions['{{#SETUP_ICON}}']:
-            result = result.replace('{{SETUP_ICON}}', str(Path(config.get('setup_icon')).resolve()).replace('/', '\\'))
-            
-        if conditions['{{#CHINESE_SUPPORT}}']:
-            chinese_isl_path = self._get_chinese_isl_path()
-            result = result.replace('{{CHINESE_ISL_PATH}}', chinese_isl_path)
-        
-        # 清理其他特殊标记
-        result = result.replace('{{LICENSE_FILE}}', '')
-        result = result.replace('{{SETUP_ICON}}', '')
-        result = result.replace('{{CHINESE_ISL_PATH}}', '')
-
-        # 执行基本替换
-        for placeholder, value in replacements.items():
-            result = result.replace(placeholder, value)
-
-        # 清理剩余的模板标记
-        import re
-        # 移除任何剩余的 {{#...}} 和 {{/...}} 标记
-        result = re.sub(r'\{\{[#/][^}]+\}\}', '', result)
-        # 移除多余的空行
-        result = re.sub(r'\n\s*\n\s*\n', '\n\n', result)
-        
+        # 条件变量：条件为假时替换为空串
+        replacements['LICENSE_FILE'] = (
+            str(Path(config.get('license_file')).resolve()).replace('/', '\\')
+            if conditions['{{#LICENSE_FILE}}'] else ''
+        )
+        replacements['SETUP_ICON'] = (
+            str(Path(config.get('setup_icon')).resolve()).replace('/', '\\')
+            if conditions['{{#SETUP_ICON}}'] else ''
+        )
+        replacements['CHINESE_ISL_PATH'] = (
+            self._get_chinese_isl_path()
+            if conditions['{{#CHINESE_SUPPORT}}'] else ''
+        )
+
+        # 单趟正则替换全部 {{VAR}}：逐变量 str.replace 每次都要
+        # 重新扫描并复制整个脚本（13 趟），这里只扫描一趟；未知
+        # 变量原样保留，交给后面的清理正则
+        result = _VAR_RE.sub(
+            lambda m: replacements.get(m.group(1), m.group(0)), result
+        )
+
+        # 清理剩余的模板标记（移除 {{#...}}/{{/...}} 和多余空行）
+        result = _TEMPLATE_TAG_RE.sub('', result)
+        result = _EXTRA_BLANK_LINES_RE.sub('\n\n', result)
+
         return result.strip()
 
     def _get_chinese_isl_path(self) -> str:
@@ -575,7 +675,8 @@ class InnoSetupPackager(BasePackager):
         # 处理路径中的反斜杠
         output_dir = str(output_path.parent).replace('/', '\\')
         
-        setup_section = f"""[Setup]
+        # 各节按行收集、末尾一次 join，避免逐段 str += 的二次拷贝
+        setup_lines = [f"""[Setup]
 AppId={app_id}
 AppName={app_name}
 AppVersion={app_version}
@@ -588,67 +689,71 @@ OutputDir={output_dir}
 OutputBaseFilename={output_path.stem}
 Compression=lzma
 SolidCompression=yes
-WizardStyle=modern"""
+WizardStyle=modern"""]
 
         # 只在存在时添加可选字段
         if app_url:
-            setup_section += f"\nAppPublisherURL={app_url}"
-            setup_section += f"\nAppSupportURL={app_url}"
-            setup_section += f"\nAppUpdatesURL={app_url}"
+            setup_lines.append(f"AppPublisherURL={app_url}")
+            setup_lines.append(f"AppSupportURL={app_url}")
+            setup_lines.append(f"AppUpdatesURL={app_url}")
 
         license_file = config.get('license_file', '')
         if license_file and os.path.exists(license_file):
             license_path = str(Path(license_file)).replace('/', '\\')
-            setup_section += f"\nLicenseFile={license_path}"
+            setup_lines.append(f"LicenseFile={license_path}")
 
         setup_icon = config.get('setup_icon', '')
         if setup_icon and os.path.exists(setup_icon):
             setup_icon_path = str(Path(setup_icon)).replace('/', '\\')
-            setup_section += f"\nSetupIconFile={setup_icon_path}"
-
-        # 语言支持
-        languages_section = "[Languages]"
-        languages = config.get("languages", ["english"])
-        if "english" in languages:
-            languages_section += (
-                '\nName: "english"; MessagesFile: "compiler:Default.isl"'
+            setup_lines.append(f"SetupIconFile={setup_icon_path}")
+
+        setup_section = "\n".join(setup_lines)
+
+        # 语言支持（查表生成，中文别名归一到 chinesesimplified）
+        language_lines = ["[Languages]"]
+        seen_languages = set()
+        for language in config.get("languages", ["english"]):
+            name = "chinesesimplified" if language == "chinese" else language
+            messages_file = _ISS_LANG_TABLE.get(name)
+            if not messages_file or name in seen_languages:
+                continue
+            seen_languages.add(name)
+            if name == "chinesesimplified" and self._project_chinese_file:
+                # 优先使用项目自带的中文语言文件
+                messages_file = os.path.abspath(
+                    self._project_chinese_file
+                ).replace("\\", "\\\\")
+            language_lines.append(
+                f'Name: "{name}"; MessagesFile: "{messages_file}"'
             )
-        if "chinesesimplified" in languages or "chinese" in languages:
-            # 优先使用项目自带的中文语言文件
-            if hasattr(self, "_project_chinese_file") and self._project_chinese_file:
-                # 使用项目自带的语言文件，需要转换为相对路径或绝对路径
-                chinese_file_path = os.path.abspath(self._project_chinese_file).replace(
-                    "\\", "\\\\"
-                )
-                languages_section += (
-                    f'\nName: "chinesesimplified"; MessagesFile: "{chinese_file_path}"'
-                )
-            else:
-                # 使用系统中的语言文件
-                languages_section += '\nName: "chinesesimplified"; MessagesFile: "compiler:Languages\\ChineseSimplified.isl"'
+        languages_section = "\n".join(language_lines)
 
         # 任务节
-        tasks_section = "[Tasks]"
+        tasks_lines = ["[Tasks]"]
         if config.get("create_desktop_icon", True):
-            tasks_section += '\nName: "desktopicon"; Description: "{cm:CreateDesktopIcon}"; GroupDescription: "{cm:AdditionalIcons}"; Flags: unchecked'
+            tasks_lines.append('Name: "desktopicon"; Description: "{cm:CreateDesktopIcon}"; GroupDescription: "{cm:AdditionalIcons}"; Flags: unchecked')
+        tasks_section = "\n".join(tasks_lines)
 
         # 文件节
         files_section = f"[Files]\n{source_files}"
 
         # 图标节 - 使用 display_name 作为快捷方式名称
-        icons_section = "[Icons]"
-        icons_section += f'\nName: "{{group}}\\{display_name}"; Filename: "{{app}}\\{exe_name}"'
-
+        icons_lines = [
+            "[Icons]",
+            f'Name: "{{group}}\\{display_name}"; Filename: "{{app}}\\{exe_name}"',
+        ]
         if config.get("create_desktop_icon", True):
-            icons_section += f'\nName: "{{autodesktop}}\\{display_name}"; Filename: "{{app}}\\{exe_name}"; Tasks: desktopicon'
-        
+            icons_lines.append(f'Name: "{{autodesktop}}\\{display_name}"; Filename: "{{app}}\\{exe_name}"; Tasks: desktopicon')
+
         # 添加卸载程序快捷方式
-        icons_section += f'\nName: "{{group}}\\{{cm:UninstallProgram,{display_name}}}"; Filename: "{{uninstallexe}}"'
+        icons_lines.append(f'Name: "{{group}}\\{{cm:UninstallProgram,{display_name}}}"; Filename: "{{uninstallexe}}"')
+        icons_section = "\n".join(icons_lines)
 
         # 运行节
-        run_section = "[Run]"
+        run_lines = ["[Run]"]
         if config.get("run_after_install", False):
-            run_section += f'\nFilename: "{{app}}\\{exe_name}"; Description: "{{cm:LaunchProgram,{display_name}}}"; Flags: nowait postinstall skipifsilent'
+            run_lines.append(f'Filename: "{{app}}\\{exe_name}"; Description: "{{cm:LaunchProgram,{display_name}}}"; Flags: nowait postinstall skipifsilent')
+        run_section = "\n".join(run_lines)
 
         # 组装完整脚本
         iss_script = f"""; Script generated by UnifyPy 2.0
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
 from pathlib import Path
 
 from unifypy.core.plugin import BasePlugin
@@ -60,20 +61,36 @@ class _RollbackFileOps(FileOperations):
         self._safe_remove_dir(p)
 
     def _safe_remove_dir(self, p: Path):
-        for item in p.iterdir():
-            if item.is_file():
-                if not self._is_ignored_file(item):
-                    self._rb.safe_delete_file(item)
-            elif item.is_dir():
-                self._safe_remove_dir(item)
-        # 尝试删除空目录（非必须）
-        try:
-            p.rmdir()
-        except Exception:
-            pass
+        # 显式栈 + scandir 遍历：DirEntry 已缓存文件类型，免去
+        # iterdir 后逐项 is_file/is_dir 的额外 stat；删除操作批量
+        # 交给 RollbackManager，日志只落盘一次
+        files = []
+        dirs = [str(p)]
+        stack = [str(p)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            dirs.append(entry.path)
+                            stack.append(entry.path)
+                        elif not self._is_ignored_file(Path(entry.path)):
+                            files.append(Path(entry.path))
+            except OSError:
+                continue
+
+        if files:
+            self._rb.safe_delete_files(files)
+
+        # 自深向浅尝试删除空目录（非必须）
+        for dir_path in reversed(dirs):
+            try:
+                os.rmdir(dir_path)
+            except OSError:
+                pass
 
-    def create_temp_dir(self, prefix: str = "unifypy_") -> str:
-        path = self._base.create_temp_dir(prefix)
+    def create_temp_dir(self, prefix: str = "unifypy_", project_dir=None) -> str:
+        path = self._base.create_temp_dir(prefix, project_dir=project_dir)
         try:
             self._rb.track_dir_creation(Path(path))
         except Exception:
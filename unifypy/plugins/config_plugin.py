@@ -9,7 +9,7 @@ from unifypy.core.context import BuildContext
 from unifypy.core.config import ConfigManager
 from unifypy.utils.file_ops import FileOperations
 from unifypy.utils.cache_manager import CacheManager
-from unifypy.platforms.registry import PackagerRegistry
+from unifypy.platforms.registry import default_registry
 from unifypy.core.environment import EnvironmentManager
 
 
@@ -23,7 +23,7 @@ class ConfigPlugin(BasePlugin):
     def load_config(self, ctx: BuildContext):
         # 准备基础组件
         ctx.file_ops = ctx.file_ops or FileOperations()
-        ctx.packager_registry = ctx.packager_registry or PackagerRegistry()
+        ctx.packager_registry = ctx.packager_registry or default_registry()
         ctx.env_manager = ctx.env_manager or EnvironmentManager(str(ctx.project_dir))
 
         # 加载配置
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
+import stat
+
 from unifypy.core.plugin import BasePlugin
 from unifypy.core.event_bus import EventBus
 from unifypy.core.events import ENVIRONMENT_CHECK
@@ -21,14 +24,22 @@ class EnvironmentPlugin(BasePlugin):
         if ctx.progress:
             ctx.progress.start_stage(stage, "验证项目配置和依赖")
 
-        # 检查项目目录与入口文件
-        if not ctx.project_dir.exists():
+        # 检查项目目录与入口文件：os.stat 直接探测，存在性判断与
+        # stat 信息一次系统调用拿到（Path.exists 内部同样是 stat，
+        # 但拿不到结果复用）
+        try:
+            os.stat(ctx.project_dir)
+        except OSError:
             raise FileNotFoundError(f"项目目录不存在: {ctx.project_dir}")
         if ctx.progress:
             ctx.progress.update_stage(stage, 10, "检查入口文件", absolute=True)
         entry_file = ctx.config.resolve_path(ctx.config.get("entry"))
-        if not entry_file.exists():
+        try:
+            entry_stat = os.stat(entry_file)
+        except OSError:
             raise FileNotFoundError(f"入口文件不存在: {entry_file}")
+        if not stat.S_ISREG(entry_stat.st_mode):
+            raise FileNotFoundError(f"入口文件不是普通文件: {entry_file}")
 
         # 工具检测
         ctx.tool_manager = ctx.tool_manager or ToolManager()
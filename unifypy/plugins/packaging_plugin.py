@@ -1,22 +1,68 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import threading
 from typing import List
 from pathlib import Path
 
 from unifypy.core.plugin import BasePlugin
 from unifypy.core.event_bus import EventBus
-from unifypy.core.events import GENERATE_INSTALLERS
+from unifypy.core.events import BUILD_EXECUTABLE, GENERATE_INSTALLERS
+from unifypy.utils.command_runner import cached_which
 from unifypy.utils.parallel_builder import ParallelBuilder
 
+# 可能需要从网络获取的打包工具：platform -> {format: tool}
+_DOWNLOADABLE_TOOLS = {
+    "macos": {"dmg": "create-dmg"},
+    "linux": {"appimage": "appimagetool"},
+}
+
 
 class PackagingPlugin(BasePlugin):
     name = "packaging"
     priority = 60
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._prefetch_thread = None
+
     def register(self, bus: EventBus):
+        # 在 PyInstaller 构建开始前启动工具预取：工具下载是网络型
+        # 任务，正好与 CPU 密集的 PyInstaller 构建重叠
+        bus.subscribe(BUILD_EXECUTABLE, self.prefetch_packaging_tools, priority=40)
         bus.subscribe(GENERATE_INSTALLERS, self.generate_installers, priority=self.priority)
 
+    def prefetch_packaging_tools(self, ctx):
+        """后台预取缺失的打包工具，与可执行文件构建并行."""
+        if getattr(ctx.args, "skip_installer", False):
+            return
+        if not getattr(ctx, "tool_manager", None):
+            return
+
+        platform = ctx.config.current_platform
+        tools = _DOWNLOADABLE_TOOLS.get(platform, {})
+        requested_formats = self._get_requested_formats(ctx, platform)
+        missing = [
+            tool
+            for fmt, tool in tools.items()
+            if fmt in requested_formats and not cached_which(tool)
+        ]
+        if not missing:
+            return
+
+        def _prefetch():
+            for tool in missing:
+                try:
+                    ctx.tool_manager.ensure_tool(tool)
+                except Exception:
+                    # 预取失败不致命：打包阶段会重试并正常报错
+                    pass
+
+        self._prefetch_thread = threading.Thread(
+            target=_prefetch, name="unifypy-tool-prefetch", daemon=True
+        )
+        self._prefetch_thread.start()
+
     def generate_installers(self, ctx):
         if getattr(ctx.args, "skip_installer", False):
             return
@@ -25,10 +71,18 @@ class PackagingPlugin(BasePlugin):
         if ctx.progress:
             ctx.progress.start_stage(stage, "生成平台特定的安装包")
 
+        # 等待后台工具预取结束（通常已在 PyInstaller 构建期间完成）
+        if self._prefetch_thread is not None:
+            self._prefetch_thread.join()
+            self._prefetch_thread = None
+
         platform = ctx.config.current_platform
         requested_formats = self._get_requested_formats(ctx, platform)
 
         if not requested_formats:
+            fut = ctx.state.pop("macos_postprocess_future", None)
+            if fut is not None:
+                fut.result()
             if ctx.progress:
                 ctx.progress.warning(f"未指定 {platform} 平台的输出格式")
                 ctx.progress.complete_stage(stage)
@@ -51,7 +105,16 @@ class PackagingPlugin(BasePlugin):
 
         processed_config = ctx.config.preprocess_paths(ctx.config.merged_config)
 
-        if getattr(ctx.args, "parallel", False) and total_formats > 1:
+        # macOS 后处理（plist/codesign）在后台进行，打包器读取
+        # .app 之前必须完成；失败则中止打包阶段
+        postprocess_future = ctx.state.pop("macos_postprocess_future", None)
+        if postprocess_future is not None:
+            postprocess_future.result()
+
+        # 多格式构建统一走线程池：每种格式几乎全部时间花在外部
+        # 打包工具（dpkg-deb/rpmbuild/appimagetool/ISCC）的子进程等待
+        # 上，属于 GIL 友好的 I/O 型负载，--parallel 不再是前提
+        if total_formats > 1:
             try:
                 with ParallelBuilder(ctx.progress, ctx.args.max_workers) as pb:
                     pb.optimize_pyinstaller_build(ctx.config.get_pyinstaller_config(), str(ctx.project_dir / ctx.config.get("entry")), ctx.project_dir)
@@ -135,11 +198,10 @@ class PackagingPlugin(BasePlugin):
             if isinstance(explicit_formats, list) and explicit_formats:
                 return explicit_formats
 
-        # fallback: 遍历平台配置的 key，检测哪些是支持的格式
-        formats = []
-        for key in platform_config.keys():
-            if ctx.packager_registry.is_format_supported(platform, key):
-                formats.append(key)
+        # fallback: 用支持格式集合做 O(1) 成员判断筛选平台配置的
+        # key（保持配置中的出现顺序）
+        supported = ctx.packager_registry.supported_formats(platform)
+        formats = [key for key in platform_config if key in supported]
 
         if not formats:
             default_formats = {
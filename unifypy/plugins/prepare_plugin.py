@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import concurrent.futures
+import contextlib
 from pathlib import Path
 
 from unifypy.core.plugin import BasePlugin
@@ -23,8 +25,19 @@ class PreparePlugin(BasePlugin):
 
         ctx.file_ops = ctx.file_ops or FileOperations()
 
+        # 配置 hash 初始化要读资源文件并计算 SHA256，与下面的目录
+        # 创建/清理互相独立，放到后台线程与之重叠；阶段结束前 join，
+        # 保证后续 BUILD_EXECUTABLE 读到的 hash 已就绪
+        hash_future = None
+        executor = None
+        if ctx.cache_manager:
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            hash_future = executor.submit(self._init_config_hashes, ctx, stage)
+
         # 创建临时目录
-        temp_dir = ctx.file_ops.create_temp_dir("unifypy_build_")
+        temp_dir = ctx.file_ops.create_temp_dir(
+            "unifypy_build_", project_dir=ctx.project_dir
+        )
         ctx.temp_dir = Path(temp_dir)
         if ctx.progress:
             ctx.progress.update_stage(stage, 20, f"创建临时目录: {ctx.temp_dir}", absolute=True)
@@ -35,18 +48,43 @@ class PreparePlugin(BasePlugin):
         if ctx.progress:
             ctx.progress.update_stage(stage, 40, "创建输出目录", absolute=True)
 
-        # 清理旧文件（按需）
+        # 清理旧文件（按需）；回滚跟踪开启时批量记录操作，
+        # 整个清理过程只落盘一次日志
         if getattr(ctx.args, "clean", False):
             if ctx.progress:
                 ctx.progress.update_stage(stage, 60, "清理旧的构建文件", absolute=True)
-            ctx.file_ops.remove_dir(str(ctx.dist_dir))
-            ctx.file_ops.remove_dir(str(ctx.installer_dir))
-            ctx.file_ops.ensure_dir(str(ctx.dist_dir))
-            ctx.file_ops.ensure_dir(str(ctx.installer_dir))
+            rb = ctx.state.get("rollback_manager")
+            with rb.batch() if rb else contextlib.nullcontext():
+                ctx.file_ops.remove_dir(str(ctx.dist_dir))
+                ctx.file_ops.remove_dir(str(ctx.installer_dir))
+                ctx.file_ops.ensure_dir(str(ctx.dist_dir))
+                ctx.file_ops.ensure_dir(str(ctx.installer_dir))
+
+        # 等待后台 hash 初始化完成
+        if hash_future is not None:
+            try:
+                hash_future.result()
+            finally:
+                executor.shutdown(wait=False)
+
+        # 预处理图标（如无效则移除，避免PyInstaller报错）
+        icon_path = ctx.config.get("icon")
+        if icon_path:
+            icon_full = ctx.config.resolve_path(icon_path)
+            if not icon_full.exists():
+                ctx.config.merged_config.pop("icon", None)
+                if "pyinstaller" in ctx.config.merged_config:
+                    ctx.config.merged_config["pyinstaller"].pop("icon", None)
+                ctx.config.invalidate_derived_config()
+
+        if ctx.progress:
+            ctx.progress.update_stage(stage, 80, "准备资源文件", absolute=True)
+            ctx.progress.complete_stage(stage)
 
-        # 初始化配置 hash（用于后续缓存检测）
+    def _init_config_hashes(self, ctx, stage):
+        """初始化配置 hash（用于后续缓存检测，在后台线程执行）."""
         try:
-            if ctx.cache_manager and ctx.cache_manager.should_pre_generate_all_configs(ctx.config.merged_config):
+            if ctx.cache_manager.should_pre_generate_all_configs(ctx.config.merged_config):
                 if ctx.progress:
                     ctx.progress.update_stage(stage, 45, "初始化配置缓存", absolute=True)
 
@@ -70,16 +108,3 @@ class PreparePlugin(BasePlugin):
         except Exception as e:
             if ctx.progress:
                 ctx.progress.warning(f"配置 hash 初始化失败: {e}")
-
-        # 预处理图标（如无效则移除，避免PyInstaller报错）
-        icon_path = ctx.config.get("icon")
-        if icon_path:
-            icon_full = ctx.config.resolve_path(icon_path)
-            if not icon_full.exists():
-                ctx.config.merged_config.pop("icon", None)
-                if "pyinstaller" in ctx.config.merged_config:
-                    ctx.config.merged_config["pyinstaller"].pop("icon", None)
-
-        if ctx.progress:
-            ctx.progress.update_stage(stage, 80, "准备资源文件", absolute=True)
-            ctx.progress.complete_stage(stage)
@@ -1,6 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import concurrent.futures
+import os
+import threading
+
 from unifypy.core.plugin import BasePlugin
 from unifypy.core.event_bus import EventBus
 from unifypy.core.events import BUILD_EXECUTABLE
@@ -10,6 +14,9 @@ from unifypy.utils.info_plist_updater import InfoPlistUpdater
 from unifypy.utils.macos_codesign import MacOSCodeSigner
 from unifypy.platforms.macos.post_processor import MacOSPostProcessor
 
+# 进程内运行 PyInstaller 需要临时 chdir，用锁串行化该窗口
+_INPROCESS_CWD_LOCK = threading.Lock()
+
 
 class PyInstallerPlugin(BasePlugin):
     name = "pyinstaller"
@@ -29,14 +36,17 @@ class PyInstallerPlugin(BasePlugin):
         # 进度回调
         cb = ProgressCallbackFactory.create_callback(ctx.progress, verbose=getattr(ctx.args, "verbose", False))
 
-        # 构建器与 macOS 处理器
+        # 构建器与 macOS 处理器（plist/签名组件只在 macOS 上用得到，
+        # 其他平台不必构造）
         builder = PyInstallerConfigBuilder(current_platform=ctx.config.current_platform, verbose=getattr(ctx.args, "verbose", False), progress_callback=cb)
-        info_plist_updater = InfoPlistUpdater(verbose=getattr(ctx.args, "verbose", False))
-        mac_codesigner = MacOSCodeSigner(verbose=getattr(ctx.args, "verbose", False))
-        mac_processor = MacOSPostProcessor(info_plist_updater, mac_codesigner, builder, verbose=getattr(ctx.args, "verbose", False))
+        mac_processor = None
+        if ctx.config.current_platform == "macos":
+            info_plist_updater = InfoPlistUpdater(verbose=getattr(ctx.args, "verbose", False))
+            mac_codesigner = MacOSCodeSigner(verbose=getattr(ctx.args, "verbose", False))
+            mac_processor = MacOSPostProcessor(info_plist_updater, mac_codesigner, builder, verbose=getattr(ctx.args, "verbose", False))
 
         # macOS: 预处理 entitlements 并合并 pyinstaller 配置
-        if mac_processor.is_macos():
+        if mac_processor is not None and mac_processor.is_macos():
             if ctx.progress:
                 ctx.progress.update_stage(stage, 5, "检查 macOS 权限配置")
             updated = mac_processor.prepare_entitlements_config(ctx.config, ctx.project_dir, ctx.args)
@@ -45,6 +55,7 @@ class PyInstallerPlugin(BasePlugin):
                     if "pyinstaller" not in ctx.config.merged_config:
                         ctx.config.merged_config["pyinstaller"] = {}
                     ctx.config.merged_config["pyinstaller"].update(updated["pyinstaller"])
+                    ctx.config.invalidate_derived_config()
 
         # 生成 spec 文件并执行
         py_cfg = ctx.config.get_pyinstaller_config()
@@ -98,20 +109,28 @@ class PyInstallerPlugin(BasePlugin):
                 ctx.cache_manager.save_config_hash(new_hash, ctx.config.current_platform)
 
         # 使用 spec 文件打包
-        command = ["pyinstaller", str(spec_file)]
-
-        # 在项目根目录执行命令（使用 cwd 参数，避免全局 chdir）
         if ctx.progress:
             ctx.progress.update_stage(stage, 20, "执行 PyInstaller", absolute=True)
-        success = ctx.runner.run_command(
-            command,
-            stage=stage,
-            step_description="运行 PyInstaller",
-            step_weight=60,
-            capture_output=True,
-            shell=False,
-            cwd=str(ctx.project_dir),
-        )
+
+        # 优先进程内运行：子进程方式每次都要重新启动解释器并从零导入
+        # 整个 PyInstaller 包（数秒开销），进程内调用可跨多次构建摊薄
+        success = self._run_pyinstaller_inprocess(ctx, spec_file)
+
+        if success is None:
+            # PyInstaller 不在当前环境中，回退到子进程方式
+            command = ["pyinstaller", str(spec_file)]
+
+            # 在项目根目录执行命令（使用 cwd 参数，避免全局 chdir）
+            success = ctx.runner.run_command(
+                command,
+                stage=stage,
+                step_description="运行 PyInstaller",
+                step_weight=60,
+                capture_output=True,
+                cwd=str(ctx.project_dir),
+            )
+        elif success and ctx.progress:
+            ctx.progress.update_stage(stage, 60, "运行 PyInstaller")
 
         if not success:
             raise RuntimeError("PyInstaller打包失败")
@@ -122,14 +141,62 @@ class PyInstallerPlugin(BasePlugin):
         # 验证输出
         self._verify_output(ctx)
 
-        # macOS 后处理
-        if mac_processor.is_macos():
+        # macOS 后处理（plist 重写 + codesign）放到后台线程，与
+        # 安装包阶段的工具检查/配置校验重叠；PackagingPlugin 在真正
+        # 读取 .app 打包前 join 该 future
+        if mac_processor is not None and mac_processor.is_macos():
             app_name = ctx.config.get("name")
-            mac_processor.process_built_app(app_name, ctx.dist_dir, ctx.config, ctx.project_dir)
+            executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            ctx.state["macos_postprocess_future"] = executor.submit(
+                mac_processor.process_built_app,
+                app_name,
+                ctx.dist_dir,
+                ctx.config,
+                ctx.project_dir,
+            )
+            executor.shutdown(wait=False)
+            # 跳过安装包阶段时没有人 join，这里直接等待
+            if getattr(ctx.args, "skip_installer", False):
+                ctx.state.pop("macos_postprocess_future").result()
 
         if ctx.progress:
             ctx.progress.complete_stage(stage)
 
+    def _run_pyinstaller_inprocess(self, ctx, spec_file):
+        """在当前进程内运行 PyInstaller.
+
+        Args:
+            ctx: 构建上下文
+            spec_file: spec 文件路径
+
+        Returns:
+            Optional[bool]: 运行是否成功；PyInstaller 无法导入时为 None
+                （调用方回退到子进程方式）
+        """
+        try:
+            from PyInstaller import __main__ as pyi_main
+        except ImportError:
+            return None
+
+        # PyInstaller 依赖当前工作目录解析相对路径，且没有 cwd=
+        # 入参可用，只能临时切换。chdir 是进程级状态，用锁保证
+        # 同一进程内不会有并发线程在切换窗口期读到错误的 CWD
+        with _INPROCESS_CWD_LOCK:
+            original_cwd = os.getcwd()
+            try:
+                os.chdir(str(ctx.project_dir))
+                pyi_main.run([str(spec_file)])
+                return True
+            except SystemExit as e:
+                # PyInstaller 失败时直接 sys.exit
+                return e.code in (0, None)
+            except Exception as e:
+                if ctx.progress:
+                    ctx.progress.on_error(e, "PyInstaller打包")
+                return False
+            finally:
+                os.chdir(original_cwd)
+
     def _verify_output(self, ctx):
         app_name = ctx.config.get("name")
         onefile = ctx.config.get_pyinstaller_config().get("onefile")
@@ -137,5 +204,10 @@ class PyInstallerPlugin(BasePlugin):
             exe_path = ctx.dist_dir / f"{app_name}{ctx.file_ops.get_executable_extension()}"
         else:
             exe_path = ctx.dist_dir / app_name / f"{app_name}{ctx.file_ops.get_executable_extension()}"
-        if not exe_path.exists():
+        # 同步执行已保证写入完成，无需定时等待；除存在性外再校验
+        # 文件非空，提前拦截截断的产物
+        try:
+            if exe_path.stat().st_size == 0:
+                raise RuntimeError(f"PyInstaller输出文件为空: {exe_path}")
+        except FileNotFoundError:
             raise RuntimeError(f"PyInstaller输出文件不存在: {exe_path}")
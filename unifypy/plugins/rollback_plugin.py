@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import datetime
+
 from unifypy.core.plugin import BasePlugin
 from unifypy.core.event_bus import EventBus
 from unifypy.core.events import HANDLE_ROLLBACK_COMMANDS
@@ -26,10 +28,17 @@ class RollbackPlugin(BasePlugin):
                 return
             print("可用的回滚会话:")
             print("-" * 60)
-            for session_id in sessions:
-                info = rb.get_session_info(session_id)
+            # 会话信息是逐个 JSON 文件读取的纯 I/O；会话较多时用
+            # 线程池并行加载，收集完再按原顺序输出
+            if len(sessions) > 8:
+                import concurrent.futures
+
+                with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                    infos = list(executor.map(rb.get_session_info, sessions))
+            else:
+                infos = [rb.get_session_info(sid) for sid in sessions]
+            for session_id, info in zip(sessions, infos):
                 if info:
-                    import datetime
                     start_time = datetime.datetime.fromtimestamp(info["start_time"]) if info.get("start_time") else None
                     print(f"会话ID: {session_id}")
                     if start_time:
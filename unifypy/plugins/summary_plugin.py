@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import os
+
 from unifypy.core.plugin import BasePlugin
 from unifypy.core.event_bus import EventBus
 from unifypy.core.events import ON_SUCCESS
@@ -28,7 +30,14 @@ class SummaryPlugin(BasePlugin):
 
         # 安装包
         if not getattr(ctx.args, "skip_installer", False) and ctx.installer_dir.exists():
-            installer_files = [str(p) for p in ctx.installer_dir.iterdir() if p.is_file()]
+            # scandir 的 DirEntry 自带文件类型，免去 iterdir 后逐项
+            # is_file 的额外 stat
+            with os.scandir(ctx.installer_dir) as entries:
+                installer_files = [
+                    entry.path
+                    for entry in entries
+                    if entry.is_file(follow_symlinks=False)
+                ]
             if installer_files:
                 output_info["安装包"] = installer_files[0] if len(installer_files) == 1 else installer_files
 
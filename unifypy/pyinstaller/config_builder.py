@@ -172,6 +172,12 @@ class PyInstallerConfigBuilder:
                 if value is not None and str(value).strip():
                     command.extend([option_flag, str(value)])
 
+        # 默认禁用 UPX：UPX 的单线程 LZMA 压缩是 PyInstaller 构建中
+        # 最慢的一步，收益有限。用户配置了 upx_dir（明确要用 UPX）或
+        # 自行设置过 noupx 时不干预。
+        if "noupx" not in config and "upx_dir" not in config:
+            command.append("--noupx")
+
         # 添加入口脚本
         command.append(entry_script)
 
@@ -254,6 +260,19 @@ class PyInstallerConfigBuilder:
             self._log(f"跳过不存在的路径: {source_path} (来自 {config_key})", 'warning')
             return False
 
+    def _upx_enabled(self, config: Dict[str, Any]) -> bool:
+        """UPX 是否启用：与 build_command 的默认 --noupx 策略保持一致.
+
+        Args:
+            config: PyInstaller配置字典
+
+        Returns:
+            bool: 是否启用UPX
+        """
+        if "noupx" in config:
+            return not config["noupx"]
+        return "upx_dir" in config
+
     def build_spec_file_content(self, config: Dict[str, Any], entry_script: str) -> str:
         """构建.spec文件内容.
 
@@ -285,7 +304,7 @@ coll = COLLECT(exe,
                a.zipfiles,
                a.datas,
                strip={str(config.get('strip', False))},
-               upx={str(not config.get('noupx', False))},
+               upx={str(self._upx_enabled(config))},
                upx_exclude={repr(config.get('upx_exclude', []))},
                name={repr(app_name)})"""
 
@@ -378,7 +397,7 @@ pyz = {pyz_config}
     debug={str(config.get('debug', False))},
     bootloader_ignore_signals=False,
     strip={str(config.get('strip', False))},
-    upx={str(not config.get('noupx', False))},
+    upx={str(self._upx_enabled(config))},
     upx_exclude={repr(config.get('upx_exclude', []))},
     runtime_tmpdir=None,
     console={str(console)},
@@ -5,6 +5,7 @@
 支持配置文件 hash 对比和智能更新机制
 """
 
+import datetime
 import os
 import json
 import hashlib
@@ -31,6 +32,13 @@ class CacheManager:
         self.unifypy_dir = self.project_dir / ".unifypy"
         self.cache_dir = self.unifypy_dir / "cache"
         self.metadata_file = self.unifypy_dir / "metadata.json"
+
+        # 模板路径只在此处拼接一次，calculate_config_hash 每次调用复用
+        templates_dir = self.project_dir / "unifypy" / "templates"
+        self._template_paths = (
+            templates_dir / "setup.iss.template",
+            templates_dir / "ChineseSimplified.isl.template",
+        )
         
         # 确保目录存在
         self._ensure_directories()
@@ -81,12 +89,8 @@ class CacheManager:
             hash_factors["resource_files"] = resource_files
 
         # 模板文件（如存在）也纳入哈希，确保模板变更触发重生
-        template_paths = [
-            self.project_dir / "unifypy" / "templates" / "setup.iss.template",
-            self.project_dir / "unifypy" / "templates" / "ChineseSimplified.isl.template",
-        ]
         template_meta = {}
-        for p in template_paths:
+        for p in self._template_paths:
             try:
                 if p.exists():
                     stat = p.stat()
@@ -178,8 +182,9 @@ class CacheManager:
         """
         try:
             if self.metadata_file.exists():
-                with open(self.metadata_file, "r", encoding="utf-8") as f:
-                    metadata = json.load(f)
+                # 二进制读 + json.loads，跳过 TextIOWrapper 的增量解码
+                with open(self.metadata_file, "rb") as f:
+                    metadata = json.loads(f.read())
 
                 if platform:
                     return metadata.get("platform_hashes", {}).get(platform)
@@ -208,7 +213,6 @@ class CacheManager:
             metadata["config_hash"] = config_hash
         
         # 更新时间戳
-        import datetime
         metadata["last_updated"] = datetime.datetime.now().isoformat()
         
         # 保存元数据
@@ -222,8 +226,8 @@ class CacheManager:
         """
         if self.metadata_file.exists():
             try:
-                with open(self.metadata_file, "r", encoding="utf-8") as f:
-                    return json.load(f)
+                with open(self.metadata_file, "rb") as f:
+                    return json.loads(f.read())
             except Exception:
                 pass
         
@@ -296,7 +300,6 @@ class CacheManager:
         # 保存到元数据
         metadata["app_id"] = app_id
         if not metadata.get("created"):
-            import datetime
             metadata["created"] = datetime.datetime.now().isoformat()
         self.save_metadata(metadata)
         
@@ -329,9 +332,12 @@ class CacheManager:
             bool: 是否成功更新
         """
         try:
-            # 读取配置文件
-            with open(config_file_path, "r", encoding="utf-8") as f:
-                config = json.load(f)
+            # 读取配置文件（容忍 BOM）
+            with open(config_file_path, "rb") as f:
+                raw = f.read()
+            if raw.startswith(b"\xef\xbb\xbf"):
+                raw = raw[3:]
+            config = json.loads(raw)
             
             # 确保结构存在
             if "platforms" not in config:
@@ -431,7 +437,6 @@ class CacheManager:
 
     def _get_current_date(self) -> str:
         """获取当前日期（RPM格式）"""
-        import datetime
         import locale
 
         try:
@@ -4,14 +4,90 @@
 静默命令执行器 只在错误时输出详细信息.
 """
 
+import collections
+import functools
+import os
+import shutil
 import subprocess
 import sys
+import threading
 import locale
 from typing import List, Optional, Union
 
 from .progress import ProgressManager
 
 
+def _popen_kwargs() -> dict:
+    """平台相关的子进程启动参数.
+
+    POSIX 上默认 close_fds=True 需要在 exec 前枚举并关闭到
+    _SC_OPEN_MAX 的文件描述符，ulimit 较高时每次 fork 都有可观开销，
+    而这里启动的都是短生命周期打包工具，无需 fd 隔离；Windows 上用
+    CREATE_NO_WINDOW 避免为每个子进程分配控制台窗口。
+
+    Returns:
+        dict: 传给 subprocess.run/Popen 的额外关键字参数
+    """
+    if sys.platform == "win32":
+        return {"creationflags": subprocess.CREATE_NO_WINDOW}
+    if os.name == "posix":
+        return {"close_fds": False}
+    return {}
+
+
+@functools.lru_cache(maxsize=None)
+def cached_which(tool_name: str) -> Optional[str]:
+    """缓存的 shutil.which 查找.
+
+    工具探测在一次构建里会被多个打包器/验证器重复触发，每次都是
+    一轮 PATH 遍历 + stat；结果在进程生命周期内不会变化，直接缓存。
+
+    Args:
+        tool_name: 工具名称
+
+    Returns:
+        Optional[str]: 工具路径，不存在时为None
+    """
+    return shutil.which(tool_name)
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_tool(tool_name: str) -> Optional[str]:
+    """探测工具是否可运行并缓存其版本输出.
+
+    先用缓存的 which 短路（不存在的工具无需 fork），存在时才
+    fork 一次 --version / --help，结果按工具名缓存。
+
+    Args:
+        tool_name: 工具名称
+
+    Returns:
+        Optional[str]: --version 的输出；工具不可用时为None，
+            可用但无版本输出时为空字符串
+    """
+    if cached_which(tool_name) is None:
+        return None
+
+    encoding = get_subprocess_encoding()
+    for probe_arg in ("--version", "--help"):
+        try:
+            result = subprocess.run(
+                [tool_name, probe_arg],
+                capture_output=True,
+                text=True,
+                encoding=encoding,
+                errors='replace',
+                **_popen_kwargs(),
+            )
+            if result.returncode == 0:
+                return result.stdout.strip() if probe_arg == "--version" else ""
+        except FileNotFoundError:
+            return None
+        except Exception:
+            continue
+    return None
+
+
 def get_subprocess_encoding() -> str:
     """
     获取 subprocess 输出的适当编码
@@ -59,7 +135,7 @@ class SilentRunner:
         step_description: str = "",
         step_weight: int = 10,
         capture_output: bool = True,
-        shell: bool = True,
+        shell: bool = False,
         cwd: Optional[str] = None,
         env: Optional[dict] = None,
     ) -> bool:
@@ -71,7 +147,8 @@ class SilentRunner:
             step_description: 步骤描述
             step_weight: 进度权重
             capture_output: 是否捕获输出
-            shell: 是否使用shell执行
+            shell: 是否经由 shell 执行（默认 False：直接 exec argv
+                列表，少一次 shell 进程且无引号转义问题）
 
         Returns:
             bool: 执行是否成功
@@ -89,17 +166,11 @@ class SilentRunner:
             # 获取系统适当的编码
             encoding = get_subprocess_encoding()
 
-            # 执行命令
+            # 执行命令：捕获模式下流式消费到环形缓冲，内存占用
+            # 恒定（PyInstaller 在大项目上会输出上兆的分析日志）
             if capture_output:
-                result = subprocess.run(
-                    command,
-                    shell=shell,
-                    capture_output=True,
-                    text=True,
-                    encoding=encoding,
-                    errors='replace',
-                    cwd=cwd,
-                    env=env,
+                returncode, stdout, stderr = self._run_streaming(
+                    command, shell, encoding, cwd, env
                 )
             else:
                 result = subprocess.run(
@@ -112,31 +183,33 @@ class SilentRunner:
                     errors='replace',
                     cwd=cwd,
                     env=env,
+                    **_popen_kwargs(),
+                )
+                returncode, stdout, stderr = (
+                    result.returncode,
+                    result.stdout,
+                    result.stderr,
                 )
 
             # 检查执行结果
-            if result.returncode == 0:
+            if returncode == 0:
                 # 成功时更新进度
                 self.progress.update_stage(stage, advance=step_weight)
 
                 # 在verbose模式下显示输出
-                if (
-                    self.progress.verbose
-                    and hasattr(result, "stdout")
-                    and result.stdout
-                ):
-                    self.progress.info(f"输出: {result.stdout.strip()}")
+                if self.progress.verbose and stdout:
+                    self.progress.info(f"输出: {stdout.strip()}")
 
                 return True
             else:
                 # 失败时显示错误信息
-                error_msg = f"命令执行失败 (返回码: {result.returncode})"
+                error_msg = f"命令执行失败 (返回码: {returncode})"
 
                 details = ""
-                if hasattr(result, "stderr") and result.stderr:
-                    details += f"\n[red]错误输出:[/red]\n{result.stderr}"
-                if hasattr(result, "stdout") and result.stdout:
-                    details += f"\n[yellow]标准输出:[/yellow]\n{result.stdout}"
+                if stderr:
+                    details += f"\n[red]错误输出:[/red]\n{stderr}"
+                if stdout:
+                    details += f"\n[yellow]标准输出:[/yellow]\n{stdout}"
 
                 cmd_str = " ".join(command) if isinstance(command, list) else command
                 details += f"\n[cyan]执行的命令:[/cyan]\n{cmd_str}"
@@ -159,6 +232,71 @@ class SilentRunner:
             self.progress.on_error(e, stage)
             return False
 
+    # 每条输出流保留的尾部行数；超出即丢弃最旧的行
+    _OUTPUT_RING_LINES = 1000
+
+    def _run_streaming(self, command, shell, encoding, cwd, env):
+        """执行子进程并将输出流式消费到环形缓冲.
+
+        stdout/stderr 各由一个后台线程逐行读入
+        deque(maxlen=_OUTPUT_RING_LINES)，无论子进程输出多少，
+        内存里只保留尾部——报错诊断需要的恰好也是尾部。
+
+        Args:
+            command: 要执行的命令
+            shell: 是否经由 shell 执行
+            encoding: 输出编码
+            cwd: 工作目录
+            env: 环境变量
+
+        Returns:
+            tuple: (返回码, stdout尾部文本, stderr尾部文本)
+        """
+        proc = subprocess.Popen(
+            command,
+            shell=shell,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding=encoding,
+            errors='replace',
+            cwd=cwd,
+            env=env,
+            **_popen_kwargs(),
+        )
+
+        rings = {
+            "stdout": collections.deque(maxlen=self._OUTPUT_RING_LINES),
+            "stderr": collections.deque(maxlen=self._OUTPUT_RING_LINES),
+        }
+
+        def _consume(stream, ring):
+            for line in stream:
+                ring.append(line)
+            stream.close()
+
+        readers = [
+            threading.Thread(
+                target=_consume, args=(proc.stdout, rings["stdout"]), daemon=True
+            ),
+            threading.Thread(
+                target=_consume, args=(proc.stderr, rings["stderr"]), daemon=True
+            ),
+        ]
+        for t in readers:
+            t.start()
+
+        try:
+            returncode = proc.wait()
+        except BaseException:
+            proc.kill()
+            proc.wait()
+            raise
+        for t in readers:
+            t.join()
+
+        return returncode, "".join(rings["stdout"]), "".join(rings["stderr"])
+
     def run_python_script(
         self,
         script_path: str,
@@ -166,23 +304,61 @@ class SilentRunner:
         stage: str,
         step_description: str = "",
         step_weight: int = 10,
+        in_process: bool = True,
     ) -> bool:
         """执行Python脚本.
 
+        默认在当前解释器内通过 runpy 执行（省去一次 Python 启动
+        ~100-300ms 和 fork/exec 开销，异常可直接传播）；
+        in_process=False 时回退为子进程执行。
+
         Args:
             script_path: 脚本路径
             args: 脚本参数
             stage: 当前阶段
             step_description: 步骤描述
             step_weight: 进度权重
+            in_process: 是否在当前进程内执行
 
         Returns:
             bool: 执行是否成功
         """
+        if in_process:
+            import runpy
+
+            if step_description:
+                self.progress.update_stage(
+                    stage, advance=0, description=step_description
+                )
+            if self.progress.verbose:
+                self.progress.info(f"进程内执行脚本: {script_path}")
+
+            old_argv = sys.argv
+            sys.argv = [script_path] + args
+            try:
+                runpy.run_path(script_path, run_name="__main__")
+                self.progress.update_stage(stage, advance=step_weight)
+                return True
+            except SystemExit as e:
+                if e.code in (0, None):
+                    self.progress.update_stage(stage, advance=step_weight)
+                    return True
+                self.progress.on_error(
+                    Exception(f"脚本执行失败 (退出码: {e.code})"),
+                    stage,
+                    f"\n脚本: {script_path}",
+                )
+                return False
+            except KeyboardInterrupt:
+                raise
+            except Exception as e:
+                self.progress.on_error(e, stage, f"\n脚本: {script_path}")
+                return False
+            finally:
+                sys.argv = old_argv
+
         command = [sys.executable, script_path] + args
-        return self.run_command(
-            command, stage, step_description, step_weight, shell=False
-        )
+        return self.run_command(command, stage, step_description, step_weight)
 
     def check_tool_available(self, tool_name: str) -> bool:
         """检查工具是否可用.
@@ -193,30 +369,7 @@ class SilentRunner:
         Returns:
             bool: 工具是否可用
         """
-        try:
-            result = subprocess.run(
-                [tool_name, "--version"],
-                capture_output=True,
-                text=True,
-                encoding=get_subprocess_encoding(),
-                errors='replace',
-            )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
-        except Exception:
-            # 有些工具可能不支持--version，尝试--help
-            try:
-                result = subprocess.run(
-                    [tool_name, "--help"],
-                    capture_output=True,
-                    text=True,
-                    encoding=get_subprocess_encoding(),
-                    errors='replace',
-                )
-                return result.returncode == 0
-            except Exception:
-                return False
+        return _probe_tool(tool_name) is not None
 
     def get_tool_version(self, tool_name: str) -> Optional[str]:
         """获取工具版本.
@@ -227,16 +380,5 @@ class SilentRunner:
         Returns:
             Optional[str]: 工具版本，如果无法获取则返回None
         """
-        try:
-            result = subprocess.run(
-                [tool_name, "--version"],
-                capture_output=True,
-                text=True,
-                encoding=get_subprocess_encoding(),
-                errors='replace',
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
-        return None
+        version = _probe_tool(tool_name)
+        return version or None
@@ -4,13 +4,441 @@
 文件操作工具 提供跨平台的文件和目录操作功能.
 """
 
+import errno
 import os
 from unifypy.core.platforms import normalize_platform
 import shutil
+import sys
 import tempfile
+import zipfile
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+# 用户态回退复制的缓冲区大小（4 MiB，适配现代 NVMe 吞吐）
+_COPY_BUFSIZE = 4 * 1024 * 1024
+
+# stdlib 默认 COPY_BUFSIZE 在 Linux 上只有 64 KiB（bpo-36103），对现代
+# NVMe 明显偏小；调大后所有仍走 shutil.copy2/copytree 的路径同样受益
+if os.name == "posix":
+    shutil.COPY_BUFSIZE = _COPY_BUFSIZE
+
+# copy_file_range 在这些错误码下应回退到其他复制方式
+# （跨文件系统 / 文件系统不支持 / 老内核缺少该系统调用）
+_COPY_RANGE_FALLBACK_ERRNOS = (
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.EOPNOTSUPP,
+)
+
+# Linux FICLONE ioctl（<linux/fs.h>）：btrfs/xfs 上整文件 reflink 克隆，
+# 无论文件多大都是 O(1) 的一次元数据操作
+_FICLONE = 0x40049409
+
+
+def _try_reflink(in_fd: int, out_fd: int) -> bool:
+    """尝试对整个文件做 copy-on-write 克隆.
+
+    Args:
+        in_fd: 源文件描述符
+        out_fd: 目标文件描述符
+
+    Returns:
+        bool: 克隆是否成功（失败时由调用方走常规复制路径）
+    """
+    if sys.platform != "linux":
+        return False
+    try:
+        import fcntl
+
+        fcntl.ioctl(out_fd, _FICLONE, in_fd)
+        return True
+    except OSError:
+        # 跨设备 / 文件系统不支持 reflink（如 ext4）
+        return False
+
+
+_VERSION_INFO_TEMPLATE = """# UTF-8
+#
+# For more details about fixed file info 'ffi' see:
+# http://msdn.microsoft.com/en-us/library/ms646997.aspx
+VSVersionInfo(
+  ffi=FixedFileInfo(
+    # filevers and prodvers should be always a tuple with four items: (1, 2, 3, 4)
+    # Set not needed items to zero 0.
+    filevers={file_version},
+    prodvers={product_version},
+    # Contains a bitmask that specifies the valid bits 'flags'r
+    mask=0x3f,
+    # Contains a bitmask that specifies the Boolean attributes of the file.
+    flags=0x0,
+    # The operating system for which this file was designed.
+    # 0x4 - NT and there is no need to change it.
+    OS=0x4,
+    # The general type of file.
+    # 0x1 - the file is an application.
+    fileType=0x1,
+    # The function of the file.
+    # 0x0 - the function is not defined for this fileType
+    subtype=0x0,
+    # Creation date and time stamp.
+    date=(0, 0)
+    ),
+  kids=[
+    StringFileInfo(
+      [
+      StringTable(
+        '040904B0',
+        [StringStruct('CompanyName', '{company}'),
+        StringStruct('FileDescription', '{description}'),
+        StringStruct('FileVersion', '{file_version_str}'),
+        StringStruct('InternalName', '{internal_name}'),
+        StringStruct('LegalCopyright', '{copyright}'),
+        StringStruct('OriginalFilename', '{original_filename}'),
+        StringStruct('ProductName', '{product_name}'),
+        StringStruct('ProductVersion', '{product_version_str}')])
+      ]), 
+    VarFileInfo([VarStruct('Translation', [1033, 1200])])
+  ]
+)"""
+
+
+def fast_copyfile(src: str, dst: str) -> str:
+    """快速复制单个文件.
+
+    优先使用 os.copy_file_range（同文件系统时内核可做服务端/reflink
+    复制），失败时回退 os.sendfile（内核态零拷贝流式传输），最终回退
+    大缓冲区 read/write 循环。复制完成后同步元数据（等价 shutil.copy2）。
+
+    增量短路：复制总是用 copystat 同步元数据，因此目标已存在且
+    (st_size, st_mtime_ns) 与源完全一致时即是上一次复制的产物，
+    直接跳过（rsync 式启发，文件系统本身就是缓存）。
+
+    Args:
+        src: 源文件路径
+        dst: 目标文件路径
+
+    Returns:
+        str: 目标文件路径
+    """
+    if os.path.islink(src):
+        # 保留符号链接本身而非复制其指向内容
+        if os.path.lexists(dst):
+            os.unlink(dst)
+        os.symlink(os.readlink(src), dst)
+        return dst
+
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+        if (
+            dst_stat.st_size == src_stat.st_size
+            and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
+        ):
+            return dst
+    except OSError:
+        pass
+
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        in_fd = fsrc.fileno()
+        out_fd = fdst.fileno()
+        size = os.fstat(in_fd).st_size
+        offset = 0
+
+        # 0. reflink 克隆：支持的文件系统上 O(1) 完成，与大小无关
+        if size and _try_reflink(in_fd, out_fd):
+            offset = size
+
+        # 1. copy_file_range: 同文件系统时零拷贝（btrfs/xfs 可 reflink）
+        if hasattr(os, "copy_file_range"):
+            try:
+                while offset < size:
+                    sent = os.copy_file_range(in_fd, out_fd, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError as exc:
+                if exc.errno not in _COPY_RANGE_FALLBACK_ERRNOS:
+                    raise
+
+        # 2. sendfile: 内核态流式传输，避免用户态数据搬运
+        if offset < size and hasattr(os, "sendfile"):
+            try:
+                while offset < size:
+                    sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                # macOS 的 sendfile 仅支持 socket 目标等情况
+                pass
+
+        # 3. 大缓冲区 read/write 回退（跨平台兜底，Windows 上是
+        # 唯一路径）；os.write 可能部分写入，循环直到整块写完
+        if offset < size:
+            os.lseek(in_fd, offset, os.SEEK_SET)
+            while True:
+                chunk = os.read(in_fd, _COPY_BUFSIZE)
+                if not chunk:
+                    break
+                view = memoryview(chunk)
+                while view:
+                    written = os.write(out_fd, view)
+                    view = view[written:]
+
+    shutil.copystat(src, dst)
+    return dst
+
+
+def fast_copytree(src: str, dst: str) -> str:
+    """递归快速复制目录树.
+
+    使用 os.scandir 遍历（DirEntry 缓存 stat 结果，避免重复系统调用），
+    文件走 fast_copyfile 的零拷贝路径。
+
+    Args:
+        src: 源目录路径
+        dst: 目标目录路径
+
+    Returns:
+        str: 目标目录路径
+    """
+    os.makedirs(dst, exist_ok=True)
+    with os.scandir(src) as entries:
+        for entry in entries:
+            target = os.path.join(dst, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                fast_copytree(entry.path, target)
+            else:
+                fast_copyfile(entry.path, target)
+    shutil.copystat(src, dst)
+    return dst
+
+
+def _copy_workers() -> int:
+    """确定并行复制的工作线程数.
+
+    可通过环境变量 UNIFYPY_COPY_WORKERS 覆盖，默认限制在 CPU 数的 4 倍
+    （复制是 I/O 密集型，sendfile/copy_file_range 期间会释放 GIL）。
+
+    Returns:
+        int: 工作线程数
+    """
+    env_value = os.environ.get("UNIFYPY_COPY_WORKERS")
+    if env_value:
+        try:
+            workers = int(env_value)
+            if workers > 0:
+                return workers
+        except ValueError:
+            pass
+    return min(32, (os.cpu_count() or 4) * 4)
+
+
+def parallel_copytree(src: str, dst: str, workers: int = None) -> str:
+    """并行快速复制目录树.
+
+    PyInstaller --onedir 输出通常是包含大量小文件的目录，逐个复制
+    完全串行且受 I/O 限制。这里用工作队列展开目录（避免深递归），
+    将单文件复制分发到线程池（底层走 fast_copyfile 的零拷贝路径），
+    以利用磁盘队列深度获得近线性加速。
+
+    Args:
+        src: 源目录路径
+        dst: 目标目录路径
+        workers: 工作线程数，默认由 _copy_workers 决定
+
+    Returns:
+        str: 目标目录路径
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if workers is None:
+        workers = _copy_workers()
+
+    # 先用工作队列同步展开目录结构（mkdir 很快且有顺序依赖），
+    # 文件复制再并行提交
+    copied_dirs = []
+    file_pairs = []
+    pending = [(src, dst)]
+    while pending:
+        cur_src, cur_dst = pending.pop()
+        os.makedirs(cur_dst, exist_ok=True)
+        copied_dirs.append((cur_src, cur_dst))
+        with os.scandir(cur_src) as entries:
+            for entry in entries:
+                target = os.path.join(cur_dst, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, target))
+                else:
+                    file_pairs.append((entry.path, target))
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(fast_copyfile, file_src, file_dst)
+            for file_src, file_dst in file_pairs
+        ]
+        for future in futures:
+            future.result()
+
+    # 目录元数据最后同步（自底向上，避免只读目录阻碍写入）
+    for dir_src, dir_dst in reversed(copied_dirs):
+        shutil.copystat(dir_src, dir_dst)
+    return dst
+
+
+def write_pieces(path, pieces, encoding: str = "utf-8") -> None:
+    """把多段文本一次写入文件.
+
+    POSIX 上用 os.writev 的 scatter-gather iovec 单次系统调用写出
+    所有片段，既不用先 join 分配一个大字符串，也避免多次小写入；
+    其他平台回退为 join + 单次 write。
+
+    Args:
+        path: 目标文件路径
+        pieces: 文本片段序列（空片段会被跳过）
+        encoding: 编码，默认 utf-8
+    """
+    buffers = [piece.encode(encoding) for piece in pieces if piece]
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, "writev") and buffers:
+            total = sum(len(buf) for buf in buffers)
+            written = os.writev(fd, buffers)
+            if written < total:
+                # 极少见的部分写：剩余部分合并补写
+                rest = b"".join(buffers)[written:]
+                while rest:
+                    rest = rest[os.write(fd, rest):]
+        elif buffers:
+            os.write(fd, b"".join(buffers))
+    finally:
+        os.close(fd)
+
+
+def linktree(src: str, dst: str) -> str:
+    """用硬链接镜像目录树（同文件系统时零数据拷贝）.
+
+    os.link 每个文件都是 O(1) 的目录项操作，不搬运任何数据；跨
+    文件系统（EXDEV）或文件系统不支持硬链接时单文件回退
+    fast_copyfile。打包器只读取 staging 结果、不会原地修改，
+    因此与源目录共享 inode 是安全的。
+
+    Args:
+        src: 源目录路径
+        dst: 目标目录路径
+
+    Returns:
+        str: 目标目录路径
+    """
+    dirs = []
+    pending = [(src, dst)]
+    while pending:
+        cur_src, cur_dst = pending.pop()
+        os.makedirs(cur_dst, exist_ok=True)
+        dirs.append((cur_src, cur_dst))
+        with os.scandir(cur_src) as entries:
+            for entry in entries:
+                target = os.path.join(cur_dst, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append((entry.path, target))
+                elif entry.is_symlink():
+                    os.symlink(os.readlink(entry.path), target)
+                else:
+                    try:
+                        os.link(entry.path, target)
+                    except OSError as exc:
+                        if exc.errno not in (errno.EXDEV, errno.EPERM, errno.EMLINK):
+                            raise
+                        fast_copyfile(entry.path, target)
+    for dir_src, dir_dst in reversed(dirs):
+        shutil.copystat(dir_src, dir_dst)
+    return dst
+
+
+def _tarpipe_copytree(src: str, dst: str) -> str:
+    """用 tar 管道复制目录树（跨文件系统时的快速路径）.
+
+    源和目标不在同一文件系统时 reflink/硬链接都不可用，
+    `tar -C src -cf - . | tar -C dst -xf -` 让两端都留在内核/工具侧
+    流水线中并行读写，比 Python 逐文件驱动快得多。
+
+    Args:
+        src: 源目录路径
+        dst: 目标目录路径
+
+    Returns:
+        str: 目标目录路径
+
+    Raises:
+        OSError: tar 不可用或退出码非零
+    """
+    import subprocess
+
+    from .command_runner import cached_which
+
+    if cached_which("tar") is None:
+        raise OSError(errno.ENOENT, "tar 不可用")
+
+    os.makedirs(dst, exist_ok=True)
+    producer = subprocess.Popen(
+        ["tar", "-C", src, "-cf", "-", "."],
+        stdout=subprocess.PIPE,
+        close_fds=False,
+    )
+    consumer = subprocess.Popen(
+        ["tar", "-C", dst, "-xf", "-"],
+        stdin=producer.stdout,
+        close_fds=False,
+    )
+    # 关闭父进程侧的管道引用，让 consumer 能收到 EOF
+    producer.stdout.close()
+    consumer_rc = consumer.wait()
+    producer_rc = producer.wait()
+    if producer_rc or consumer_rc:
+        raise OSError(errno.EIO, f"tar 管道复制失败: {producer_rc}/{consumer_rc}")
+    return dst
+
+
+def stage_dist_tree(src: str, dst: str, use_iouring: bool = False) -> str:
+    """把 PyInstaller 产物目录整树staging到打包构建目录.
+
+    源和目标在同一文件系统时优先用 linktree 硬链接（零数据拷贝）；
+    否则 use_iouring 为真且内核支持时走 io_uring 批量 I/O 路径（合并
+    系统调用），跨文件系统时优先 tar 管道，最后退到
+    parallel_copytree 的线程池零拷贝路径。
+
+    Args:
+        src: 源目录路径
+        dst: 目标目录路径
+        use_iouring: 是否尝试 io_uring 批量复制
+
+    Returns:
+        str: 目标目录路径
+    """
+    same_device = False
+    try:
+        dst_parent = os.path.dirname(dst) or "."
+        same_device = os.stat(src).st_dev == os.stat(dst_parent).st_dev
+    except OSError:
+        pass
+    if same_device:
+        return linktree(src, dst)
+    if use_iouring:
+        try:
+            from .iouring_copy import iouring_copytree
+
+            return iouring_copytree(src, dst)
+        except OSError:
+            # 内核不支持/被禁用时静默回退
+            pass
+    # 跨文件系统：优先 tar 管道（两端都在内核/工具侧流水线中）
+    try:
+        return _tarpipe_copytree(src, dst)
+    except OSError:
+        pass
+    return parallel_copytree(src, dst)
+
 
 class FileOperations:
     """
@@ -23,36 +451,101 @@ class FileOperations:
         """
         self.current_platform = normalize_platform()
 
-    def create_temp_dir(self, prefix: str = "unifypy_") -> str:
+    # UNIFYPY_CACHE=1 时使用的稳定构建目录集合；这些目录跨构建
+    # 复用（保留 PyInstaller 的分析缓存），退出时不清理
+    _stable_temp_dirs = set()
+
+    # 稳定缓存目录超过该时长未被使用则在清扫时删除
+    _CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600
+
+    def create_temp_dir(self, prefix: str = "unifypy_", project_dir=None) -> str:
         """创建临时目录.
 
+        设置环境变量 UNIFYPY_CACHE=1 时，返回按项目路径哈希的稳定
+        目录 ~/.cache/unifypy/<hash>/build 并导出
+        PYINSTALLER_CONFIG_DIR 指向其下的 pyinstaller_cache：二次
+        构建可以复用 PyInstaller 的缓存，显著加快未变更依赖的重建。
+
         Args:
             prefix: 目录名前缀
+            project_dir: 项目目录（用于派生稳定缓存路径）
 
         Returns:
             str: 临时目录路径
         """
+        if os.environ.get("UNIFYPY_CACHE") == "1":
+            import hashlib
+
+            key_source = str(Path(project_dir or Path.cwd()).resolve())
+            key = hashlib.sha256(key_source.encode("utf-8")).hexdigest()[:16]
+            stable_dir = Path.home() / ".cache" / "unifypy" / key / "build"
+            stable_dir.mkdir(parents=True, exist_ok=True)
+            os.environ.setdefault(
+                "PYINSTALLER_CONFIG_DIR", str(stable_dir / "pyinstaller_cache")
+            )
+            FileOperations._stable_temp_dirs.add(str(stable_dir))
+            return str(stable_dir)
+
         return tempfile.mkdtemp(prefix=prefix)
 
     def cleanup_temp_dir(self, temp_dir: str):
         """清理临时目录.
 
+        稳定缓存目录不删除（下次构建还要复用），改为清扫同级的
+        过旧缓存条目。
+
         Args:
             temp_dir: 临时目录路径
         """
+        if temp_dir in FileOperations._stable_temp_dirs:
+            self._sweep_stale_caches(Path(temp_dir).parent.parent)
+            return
+
         if os.path.exists(temp_dir):
             try:
                 shutil.rmtree(temp_dir)
             except Exception as e:
                 print(f"警告: 无法完全清理临时目录 {temp_dir}: {e}")
 
+    def _sweep_stale_caches(self, cache_root: Path):
+        """删除长期未使用的稳定缓存条目（按目录 mtime 判断）.
+
+        Args:
+            cache_root: 缓存根目录（~/.cache/unifypy）
+        """
+        import time
+
+        cutoff = time.time() - self._CACHE_MAX_AGE_SECONDS
+        active = {str(Path(d).parent) for d in FileOperations._stable_temp_dirs}
+        try:
+            with os.scandir(cache_root) as entries:
+                stale = [
+                    entry.path
+                    for entry in entries
+                    if entry.is_dir(follow_symlinks=False)
+                    and entry.path not in active
+                    and entry.stat().st_mtime < cutoff
+                ]
+        except OSError:
+            return
+        for path in stale:
+            shutil.rmtree(path, ignore_errors=True)
+
+    # 本进程内已确认存在的目录；重复 ensure_dir（每个打包器都会对
+    # 输出目录来一次）直接短路，省掉 mkdir/stat 系统调用
+    _ensured_dirs = set()
+
     def ensure_dir(self, dir_path: str):
         """确保目录存在，不存在则创建.
 
         Args:
             dir_path: 目录路径
         """
-        Path(dir_path).mkdir(parents=True, exist_ok=True)
+        path = os.path.abspath(dir_path)
+        if path in FileOperations._ensured_dirs:
+            return
+        Path(path).mkdir(parents=True, exist_ok=True)
+        FileOperations._ensured_dirs.add(path)
 
     def copy_file(self, src: str, dst: str):
         """复制文件.
@@ -62,7 +555,7 @@ class FileOperations:
             dst: 目标文件路径
         """
         self.ensure_dir(os.path.dirname(dst))
-        shutil.copy2(src, dst)
+        fast_copyfile(src, dst)
 
     def copy_tree(self, src: str, dst: str):
         """复制目录树.
@@ -73,7 +566,56 @@ class FileOperations:
         """
         if os.path.exists(dst):
             shutil.rmtree(dst)
-        shutil.copytree(src, dst)
+        fast_copytree(src, dst)
+
+    def create_zip_archive(
+        self, source_dir: str, zip_path: str, compress: bool = False
+    ):
+        """打包目录为 zip 归档.
+
+        默认使用 ZIP_STORED：打包产物以 dylib/so/pyd 等接近不可压缩
+        的二进制为主，DEFLATE 只消耗 CPU、体积收益可以忽略。符号链接
+        按链接本身存储（.app 的 Frameworks 结构依赖这一点）。
+
+        Args:
+            source_dir: 源目录路径
+            zip_path: 输出zip文件路径
+            compress: 是否启用DEFLATE压缩（默认不压缩）
+        """
+        compression = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+        source_dir = os.path.abspath(source_dir)
+        arc_base = os.path.dirname(source_dir)
+
+        # 1 MiB 复用缓冲区：zipfile.write 内部走 8 KiB copyfileobj，
+        # 大文件成员的吞吐被系统调用次数卡住
+        buffer = memoryview(bytearray(1024 * 1024))
+
+        with zipfile.ZipFile(
+            zip_path, "w", compression=compression, allowZip64=True
+        ) as zf:
+            for dirpath, dirnames, filenames in os.walk(source_dir):
+                for name in filenames + dirnames:
+                    path = os.path.join(dirpath, name)
+                    arcname = os.path.relpath(path, arc_base)
+                    if os.path.islink(path):
+                        # 以符号链接形式写入（external_attr 标记 S_IFLNK）
+                        info = zipfile.ZipInfo(arcname)
+                        info.create_system = 3
+                        info.external_attr = 0xA1FF << 16
+                        zf.writestr(info, os.readlink(path))
+                    elif name in dirnames:
+                        continue
+                    else:
+                        info = zipfile.ZipInfo.from_file(path, arcname)
+                        info.compress_type = compression
+                        with open(path, "rb") as src, zf.open(
+                            info, "w"
+                        ) as member:
+                            while True:
+                                read = src.readinto(buffer)
+                                if not read:
+                                    break
+                                member.write(buffer[:read])
 
     def move_file(self, src: str, dst: str):
         """移动文件.
@@ -103,6 +645,15 @@ class FileOperations:
         if os.path.exists(dir_path):
             shutil.rmtree(dir_path)
 
+        # 失效缓存：被删目录及其子目录不再视为已存在
+        path = os.path.abspath(dir_path)
+        prefix = path + os.sep
+        FileOperations._ensured_dirs = {
+            p
+            for p in FileOperations._ensured_dirs
+            if p != path and not p.startswith(prefix)
+        }
+
     def get_file_size(self, file_path: str) -> int:
         """获取文件大小.
 
@@ -112,7 +663,11 @@ class FileOperations:
         Returns:
             int: 文件大小（字节）
         """
-        return os.path.getsize(file_path) if os.path.exists(file_path) else 0
+        # 单次 stat：exists + getsize 要走两次系统调用
+        try:
+            return os.stat(file_path).st_size
+        except OSError:
+            return 0
 
     def format_file_size(self, size_bytes: int) -> str:
         """格式化文件大小.
@@ -211,50 +766,6 @@ class FileOperations:
             app_info: 应用信息字典
             output_path: 输出文件路径
         """
-        version_template = """# UTF-8
-#
-# For more details about fixed file info 'ffi' see:
-# http://msdn.microsoft.com/en-us/library/ms646997.aspx
-VSVersionInfo(
-  ffi=FixedFileInfo(
-    # filevers and prodvers should be always a tuple with four items: (1, 2, 3, 4)
-    # Set not needed items to zero 0.
-    filevers={file_version},
-    prodvers={product_version},
-    # Contains a bitmask that specifies the valid bits 'flags'r
-    mask=0x3f,
-    # Contains a bitmask that specifies the Boolean attributes of the file.
-    flags=0x0,
-    # The operating system for which this file was designed.
-    # 0x4 - NT and there is no need to change it.
-    OS=0x4,
-    # The general type of file.
-    # 0x1 - the file is an application.
-    fileType=0x1,
-    # The function of the file.
-    # 0x0 - the function is not defined for this fileType
-    subtype=0x0,
-    # Creation date and time stamp.
-    date=(0, 0)
-    ),
-  kids=[
-    StringFileInfo(
-      [
-      StringTable(
-        '040904B0',
-        [StringStruct('CompanyName', '{company}'),
-        StringStruct('FileDescription', '{description}'),
-        StringStruct('FileVersion', '{file_version_str}'),
-        StringStruct('InternalName', '{internal_name}'),
-        StringStruct('LegalCopyright', '{copyright}'),
-        StringStruct('OriginalFilename', '{original_filename}'),
-        StringStruct('ProductName', '{product_name}'),
-        StringStruct('ProductVersion', '{product_version_str}')])
-      ]), 
-    VarFileInfo([VarStruct('Translation', [1033, 1200])])
-  ]
-)"""
-
         # 解析版本号
         version = app_info.get("version", "1.0.0")
         version_parts = version.split(".")
@@ -264,8 +775,8 @@ VSVersionInfo(
         file_version = tuple(int(part) for part in version_parts[:4])
         product_version = file_version
 
-        # 填充模板
-        version_info = version_template.format(
+        # 填充模板（模块级模板常量，免去每次调用重建 ~1KB 字符串）
+        version_info = _VERSION_INFO_TEMPLATE.format(
             file_version=file_version,
             product_version=product_version,
             company=app_info.get("publisher", "Unknown Publisher"),
@@ -282,8 +793,8 @@ VSVersionInfo(
             product_version_str=version,
         )
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(version_info)
+        # 单次系统调用写出
+        write_pieces(output_path, [version_info])
 
     def normalize_path(self, path: str, target_platform: Optional[str] = None) -> str:
         """规范化路径格式.
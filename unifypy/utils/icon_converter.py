@@ -74,7 +74,11 @@ class IconConverter:
         return str(source_path)
 
     def _convert_png_to_icns(self, png_path: Path, icns_path: Path) -> bool:
-        """使用 macOS 系统工具将 PNG 转换为 ICNS.
+        """将 PNG 转换为 ICNS.
+
+        优先在进程内用 Pillow 完成（零子进程），Pillow 不可用或转换
+        失败时回退 macOS 系统工具（sips 逐尺寸缩放 + iconutil，共
+        十余次 fork）。
 
         Args:
             png_path: 源 PNG 文件
@@ -83,6 +87,10 @@ class IconConverter:
         Returns:
             bool: 转换是否成功
         """
+        if self._convert_with_pillow(png_path, icns_path):
+            self._print(f"✅ 图标转换成功: {png_path.name} -> {icns_path.name}")
+            return True
+
         try:
             # 创建临时 iconset 目录
             with tempfile.TemporaryDirectory() as temp_dir:
@@ -131,6 +139,40 @@ class IconConverter:
             print(f"❌ 图标转换异常: {e}")  # 错误信息始终显示
             return False
 
+    def _convert_with_pillow(self, png_path: Path, icns_path: Path) -> bool:
+        """使用 Pillow 在进程内生成 ICNS（不派生任何子进程）.
+
+        Args:
+            png_path: 源 PNG 文件
+            icns_path: 目标 ICNS 文件
+
+        Returns:
+            bool: 转换是否成功（Pillow 不可用时为 False）
+        """
+        try:
+            from PIL import Image
+        except ImportError:
+            return False
+
+        try:
+            with Image.open(png_path) as source:
+                image = source.convert("RGBA")
+
+            # ICNS 要求的标准尺寸集；以 1024px 为主图，其余尺寸
+            # 作为附加图写入同一文件
+            sizes = [16, 32, 64, 128, 256, 512, 1024]
+            base = (
+                image
+                if image.size == (1024, 1024)
+                else image.resize((1024, 1024), Image.LANCZOS)
+            )
+            extra = [base.resize((s, s), Image.LANCZOS) for s in sizes[:-1]]
+            base.save(icns_path, format="ICNS", append_images=extra)
+            return True
+        except Exception as e:
+            self._print(f"ℹ️  Pillow 转换失败，回退系统工具: {e}")
+            return False
+
     def _resize_with_sips(self, source: Path, target: Path, size: int) -> bool:
         """
         使用 sips 调整图像大小.
@@ -4,6 +4,7 @@
 MacOS Info.plist 更新器 在 PyInstaller 构建完成后，更新 Info.plist 添加权限描述.
 """
 
+import plistlib
 import subprocess
 from pathlib import Path
 from typing import Any, Dict
@@ -77,30 +78,46 @@ class InfoPlistUpdater:
         # 备份原始文件
         backup_path = info_plist_path.with_suffix(".plist.backup")
         try:
-            import shutil
+            from .file_ops import fast_copyfile
 
-            shutil.copy2(info_plist_path, backup_path)
+            fast_copyfile(str(info_plist_path), str(backup_path))
             self._print(f"✅ Info.plist 已备份: {backup_path}")
         except Exception as e:
             self._print(f"⚠️ 备份失败: {e}")
 
+        # 收集全部待写入的权限描述
+        updates = {
+            self.PERMISSION_MAPPING[config_key]: description
+            for config_key, description in macos_config.items()
+            if config_key in self.PERMISSION_MAPPING and description
+        }
+
+        # 快路径：一次 plistlib 读写批量更新全部键。PlistBuddy 每次
+        # 调用都要 fork + 完整解析再重写整个 plist，逐键调用的开销
+        # 是键数的两倍；这里整个更新只做一轮解析和序列化。
+        try:
+            self._apply_updates_plistlib(info_plist_path, updates, macos_config)
+            for plist_key, description in updates.items():
+                self._print(f"  ✅ {plist_key}: {description[:50]}...")
+            self._print(f"📋 权限描述更新完成: {len(updates)}/{len(updates)}")
+            return len(updates) > 0
+        except Exception as e:
+            self._print(f"⚠️ plistlib 批量更新失败，回退到 PlistBuddy: {e}")
+
         success_count = 0
         total_permissions = 0
 
-        # 添加权限描述
-        for config_key, description in macos_config.items():
-            if config_key in self.PERMISSION_MAPPING and description:
-                plist_key = self.PERMISSION_MAPPING[config_key]
-
-                if self._update_plist_permission(
-                    info_plist_path, plist_key, description
-                ):
-                    success_count += 1
-                    self._print(f"  ✅ {plist_key}: {description[:50]}...")
-                else:
-                    print(f"  ❌ {plist_key}: 更新失败")  # 错误信息始终显示
+        # 回退路径：逐键 PlistBuddy 更新
+        for plist_key, description in updates.items():
+            if self._update_plist_permission(
+                info_plist_path, plist_key, description
+            ):
+                success_count += 1
+                self._print(f"  ✅ {plist_key}: {description[:50]}...")
+            else:
+                print(f"  ❌ {plist_key}: 更新失败")  # 错误信息始终显示
 
-                total_permissions += 1
+            total_permissions += 1
 
         # 添加一些特殊权限
         self._add_special_permissions(info_plist_path, macos_config)
@@ -108,6 +125,41 @@ class InfoPlistUpdater:
         self._print(f"📋 权限描述更新完成: {success_count}/{total_permissions}")
         return success_count > 0
 
+    def _apply_updates_plistlib(
+        self,
+        plist_path: Path,
+        updates: Dict[str, str],
+        macos_config: Dict[str, Any],
+    ):
+        """单次读写批量更新 Info.plist.
+
+        Args:
+            plist_path: plist 文件路径
+            updates: 待写入的权限描述键值对
+            macos_config: macOS 配置字典（用于特殊权限判断）
+        """
+        with open(plist_path, "rb") as f:
+            plist_data = plistlib.load(f)
+
+        plist_data.update(updates)
+
+        # 特殊权限：后台音频模式
+        if macos_config.get("audio_usage_description") or macos_config.get(
+            "microphone_usage_description"
+        ):
+            background_modes = plist_data.setdefault("UIBackgroundModes", [])
+            if "audio" not in background_modes:
+                background_modes.append("audio")
+                self._print("  ✅ 添加后台音频权限")
+
+        # 特殊权限：音频会话类别
+        if macos_config.get("audio_usage_description"):
+            plist_data.setdefault("AVAudioSessionCategoryPlayAndRecord", True)
+            self._print("  ✅ 添加音频会话类别")
+
+        with open(plist_path, "wb") as f:
+            plistlib.dump(plist_data, f)
+
     def _update_plist_permission(
         self, plist_path: Path, key: str, description: str
     ) -> bool:
@@ -130,12 +182,11 @@ class InfoPlistUpdater:
                 str(plist_path),
             ]
 
+            # 只关心返回码，输出直接丢弃
             result = subprocess.run(
                 add_cmd,
-                capture_output=True,
-                text=True,
-                encoding=get_subprocess_encoding(),
-                errors='replace',
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=False
             )
 
@@ -150,10 +201,8 @@ class InfoPlistUpdater:
 
                 result = subprocess.run(
                     set_cmd,
-                    capture_output=True,
-                    text=True,
-                    encoding=get_subprocess_encoding(),
-                    errors='replace',
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     check=False
                 )
 
@@ -181,9 +230,8 @@ class InfoPlistUpdater:
                         "Add :UIBackgroundModes array",
                         str(plist_path),
                     ],
-                    capture_output=True,
-                    encoding=get_subprocess_encoding(),
-                    errors='replace',
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     check=False,
                 )
 
@@ -195,9 +243,8 @@ class InfoPlistUpdater:
                         'Add :UIBackgroundModes:0 string "audio"',
                         str(plist_path),
                     ],
-                    capture_output=True,
-                    encoding=get_subprocess_encoding(),
-                    errors='replace',
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     check=False,
                 )
 
@@ -216,9 +263,8 @@ class InfoPlistUpdater:
                         "Add :AVAudioSessionCategoryPlayAndRecord bool true",
                         str(plist_path),
                     ],
-                    capture_output=True,
-                    encoding=get_subprocess_encoding(),
-                    errors='replace',
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     check=False,
                 )
 
@@ -243,6 +289,20 @@ class InfoPlistUpdater:
 
         permissions = {}
 
+        # 快路径：一次 plistlib 解析读出全部键。逐键 PlistBuddy Print
+        # 要为每个权限键阻塞等待一个子进程（20+ 次 fork + 完整解析），
+        # 串行叠加的等待时间远超一次本地解析。
+        try:
+            with open(info_plist_path, "rb") as f:
+                plist_data = plistlib.load(f)
+            return {
+                plist_key: str(plist_data[plist_key])
+                for plist_key in self.PERMISSION_MAPPING.values()
+                if plist_key in plist_data
+            }
+        except Exception as e:
+            self._print(f"⚠️ plistlib 读取失败，回退到 PlistBuddy: {e}")
+
         for plist_key in self.PERMISSION_MAPPING.values():
             try:
                 cmd = [
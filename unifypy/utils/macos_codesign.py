@@ -4,12 +4,18 @@
 MacOS 代码签名工具 为未签名应用执行 ad-hoc 签名以应用 entitlements.
 """
 
+import concurrent.futures
+import os
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from .command_runner import get_subprocess_encoding
 
+# 单次 codesign 调用携带的最大路径数/总字符数（保持在 argv 限制内）
+_SIGN_BATCH_FILES = 100
+_SIGN_BATCH_CHARS = 100_000
+
 
 class MacOSCodeSigner:
     """
@@ -50,15 +56,21 @@ class MacOSCodeSigner:
             self._print("  🗑️  移除现有代码签名...")
             self._remove_existing_signature(app_path)
 
-            # 执行 ad-hoc 签名
+            # 先批量签名嵌套二进制（按深度从深到浅），替代 --deep 在
+            # 内部逐个文件串行签名；失败时回退到传统 --deep 整包签名
+            nested_ok = self._sign_nested_binaries(app_path)
+
+            # 最后对 .app 本体签名（附带 entitlements）
             codesign_cmd = self.codesign_path if self.codesign_path else "codesign"
             cmd = [
                 codesign_cmd,
                 "--force",
-                "--deep",
                 "--sign", "-",
                 "--options", "runtime",
             ]
+            if not nested_ok:
+                self._print("  ⚠️  批量签名失败，回退到 --deep")
+                cmd.insert(2, "--deep")
 
             if entitlements_path and entitlements_path.exists():
                 cmd.extend(["--entitlements", str(entitlements_path)])
@@ -70,9 +82,11 @@ class MacOSCodeSigner:
 
             self._print(f"  🚀 执行签名命令: {' '.join(cmd)}")
 
+            # stdout 从不读取：直接丢弃，避免管道缓冲整份输出
             result = subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 encoding=get_subprocess_encoding(),
                 errors='replace',
@@ -101,6 +115,96 @@ class MacOSCodeSigner:
             print(f"❌ 代码签名异常: {e}")  # 错误信息始终显示
             return False
 
+    def _collect_sign_targets(self, app_path: Path) -> Dict[int, List[str]]:
+        """收集需要单独签名的嵌套二进制，按目录深度分组.
+
+        PyInstaller 包里的可签名对象基本都是 .dylib/.so 和
+        Frameworks/MacOS 下带执行位的文件；主可执行文件由最后的
+        .app 整体签名覆盖。
+
+        Args:
+            app_path: .app 包路径
+
+        Returns:
+            Dict[int, List[str]]: 深度 -> 文件路径列表
+        """
+        targets: Dict[int, List[str]] = {}
+        main_executable = self._find_main_executable(app_path)
+        for dirpath, _dirnames, filenames in os.walk(app_path):
+            depth = dirpath.count(os.sep)
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                if main_executable and path == str(main_executable):
+                    continue
+                if filename.endswith((".dylib", ".so")):
+                    targets.setdefault(depth, []).append(path)
+                elif os.access(path, os.X_OK) and not os.path.islink(path):
+                    targets.setdefault(depth, []).append(path)
+        return targets
+
+    def _sign_nested_binaries(self, app_path: Path) -> bool:
+        """按深度从深到浅批量签名嵌套二进制.
+
+        同一深度的各批次互不依赖，可以并行跑多个 codesign 进程；
+        一次调用带多个路径，摊薄进程启动和哈希 I/O 开销。
+
+        Args:
+            app_path: .app 包路径
+
+        Returns:
+            bool: 全部批次是否签名成功
+        """
+        codesign_cmd = self.codesign_path if self.codesign_path else "codesign"
+        targets = self._collect_sign_targets(app_path)
+        if not targets:
+            return True
+
+        def _sign_batch(paths: List[str]) -> bool:
+            cmd = [
+                codesign_cmd,
+                "--force",
+                "--sign", "-",
+                "--options", "runtime",
+            ] + paths
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding=get_subprocess_encoding(),
+                errors='replace',
+                check=False,
+            )
+            if result.returncode != 0:
+                self._print(f"  ⚠️  批量签名失败: {result.stderr.strip()[:200]}")
+            return result.returncode == 0
+
+        max_workers = min(8, os.cpu_count() or 4)
+        for depth in sorted(targets, reverse=True):
+            # 按路径数和总字符数切批，保持在 argv 限制内
+            batches: List[List[str]] = []
+            batch: List[str] = []
+            batch_chars = 0
+            for path in targets[depth]:
+                if batch and (
+                    len(batch) >= _SIGN_BATCH_FILES
+                    or batch_chars + len(path) > _SIGN_BATCH_CHARS
+                ):
+                    batches.append(batch)
+                    batch = []
+                    batch_chars = 0
+                batch.append(path)
+                batch_chars += len(path) + 1
+            if batch:
+                batches.append(batch)
+
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
+                if not all(executor.map(_sign_batch, batches)):
+                    return False
+        return True
+
     def _remove_existing_signature(self, app_path: Path) -> bool:
         """
         移除现有的代码签名.
@@ -115,9 +219,8 @@ class MacOSCodeSigner:
                 cmd = [codesign_cmd, "--remove-signature", str(executable_path)]
                 subprocess.run(
                     cmd,
-                    capture_output=True,
-                    encoding=get_subprocess_encoding(),
-                    errors='replace',
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     check=False
                 )
             return True
@@ -176,7 +279,8 @@ class MacOSCodeSigner:
             cmd = [codesign_cmd, "-dv", "--verbose=4", str(app_path)]
             result = subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 encoding=get_subprocess_encoding(),
                 errors='replace',
@@ -6,10 +6,43 @@
 
 import concurrent.futures
 import os
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 
+def _latest_mtime(root: Path, suffix: str = "") -> Optional[float]:
+    """单次 scandir 遍历求目录树内文件的最新修改时间.
+
+    相比 glob("**/*") 先物化完整列表再逐个 stat，DirEntry 在遍历时
+    已缓存 stat 结果，整棵树只需一轮系统调用。
+
+    Args:
+        root: 遍历的根目录
+        suffix: 只统计以该后缀结尾的文件（空串表示全部文件）
+
+    Returns:
+        Optional[float]: 最新的 st_mtime，无匹配文件时为None
+    """
+    latest = None
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and entry.name.endswith(
+                        suffix
+                    ):
+                        mtime = entry.stat().st_mtime
+                        if latest is None or mtime > latest:
+                            latest = mtime
+        except OSError:
+            continue
+    return latest
+
+
 class ParallelBuilder:
     """
     并行构建器，支持多格式同时打包.
@@ -26,6 +59,11 @@ class ParallelBuilder:
         self.max_workers = max_workers or min(4, (os.cpu_count() or 1) + 1)
         self._executor = None
 
+        # 各格式线程共享的长生命周期组件（懒初始化）
+        self._runner = None
+        self._tool_manager = None
+        self._component_lock = threading.Lock()
+
     def __enter__(self):
         """
         进入上下文管理器.
@@ -79,11 +117,12 @@ class ParallelBuilder:
                 self.progress.warning(f"未找到 {platform}/{format_type} 格式的打包器")
                 continue
 
-            # 创建打包器实例
+            # 创建打包器实例（runner/tool_manager 由
+            # _build_single_format 注入共享实例）
             packager = packager_class(
                 self.progress,
-                None,  # 每个线程将创建自己的runner
-                None,  # 每个线程将创建自己的tool_manager
+                None,
+                None,
                 config,
                 config_file_path,
             )
@@ -160,16 +199,11 @@ class ParallelBuilder:
             bool: 构建是否成功
         """
         try:
-            # 为此线程创建独立的组件
-            from ..utils.command_runner import SilentRunner
-            from ..utils.tool_manager import ToolManager
-
-            runner = SilentRunner(self.progress)
-            tool_manager = ToolManager()
-
-            # 更新打包器的组件引用
-            packager.runner = runner
-            packager.tool_manager = tool_manager
+            # 所有格式线程共享同一组长生命周期组件：SilentRunner 无
+            # 跨调用状态，ToolManager 初始化要做目录创建等磁盘 I/O，
+            # 逐线程重建只是重复开销
+            packager.runner = self._shared_runner()
+            packager.tool_manager = self._shared_tool_manager()
 
             # 执行打包
             return packager.package(format_type, source_path, output_path)
@@ -180,6 +214,23 @@ class ParallelBuilder:
             )
             return False
 
+    def _shared_runner(self):
+        """懒初始化并复用单个 SilentRunner 实例."""
+        if self._runner is None:
+            from ..utils.command_runner import SilentRunner
+
+            self._runner = SilentRunner(self.progress)
+        return self._runner
+
+    def _shared_tool_manager(self):
+        """懒初始化并复用单个 ToolManager 实例."""
+        with self._component_lock:
+            if self._tool_manager is None:
+                from ..utils.tool_manager import ToolManager
+
+                self._tool_manager = ToolManager()
+            return self._tool_manager
+
     def optimize_pyinstaller_build(
         self, config: Dict[str, Any], entry_script: str, project_dir: Path
     ) -> bool:
@@ -224,22 +275,16 @@ class ParallelBuilder:
             if not (build_dir.exists() and dist_dir.exists()):
                 return False
 
-            # 检查源文件修改时间
-            source_files = list(project_dir.glob("**/*.py"))
-            if not source_files:
+            # 检查源文件修改时间（单次遍历，无需物化文件列表）
+            latest_source_time = _latest_mtime(project_dir, ".py")
+            if latest_source_time is None:
                 return False
 
-            latest_source_time = max(f.stat().st_mtime for f in source_files)
-
             # 检查构建目录的修改时间
-            build_files = list(build_dir.glob("**/*"))
-            if not build_files:
+            latest_build_time = _latest_mtime(build_dir)
+            if latest_build_time is None:
                 return False
 
-            latest_build_time = max(
-                f.stat().st_mtime for f in build_files if f.is_file()
-            )
-
             # 如果构建文件比源文件新，可以增量构建
             return latest_build_time > latest_source_time
 
@@ -260,14 +305,10 @@ class ParallelBuilder:
         if not config.get("debug", False) and "strip" not in config:
             optimizations["strip"] = True
 
-        # 启用UPX压缩（如果可用且未禁用）
-        if not config.get("noupx", False) and "upx_dir" not in config:
-            import shutil
-
-            if shutil.which("upx"):
-                optimizations["noupx"] = False
-                self.progress.info("检测到UPX，启用可执行文件压缩")
-
+        # UPX 保持默认关闭：自动探测并启用会把构建耗时最长的单线程
+        # 压缩步骤重新加回来（onefile 下还拖慢首次运行的自解压），
+        # 与 config_builder 的默认 --noupx 策略矛盾。用户通过
+        # upx_dir/noupx 显式要求时 config_builder 会原样透传。
         return optimizations
 
 
@@ -4,6 +4,7 @@
 进度条管理系统 提供统一的进度显示和状态管理.
 """
 
+import threading
 import time
 from typing import Any, Dict
 
@@ -102,6 +103,9 @@ class ProgressManager:
             refresh_per_second=10,  # 每秒刷新10次，确保时间显示实时更新
         )
 
+        # 并行打包时多个格式线程会同时汇报进度，串行化更新操作
+        self._update_lock = threading.Lock()
+
         self.tasks: Dict[str, TaskID] = {}
         self.stage_start_times: Dict[str, float] = {}
         self.stage_durations: Dict[str, float] = {}
@@ -183,31 +187,33 @@ class ProgressManager:
             absolute: 如果为True，advance表示绝对进度值；如果为False，表示增量
         """
         if self.verbose and description:
-            self.console.print(f"   • {description}")
+            with self._update_lock:
+                self.console.print(f"   • {description}")
             return
 
         if stage_name in self.tasks:
             task_id = self.tasks[stage_name]
-            if absolute:
-                # 绝对进度设置
-                if description:
-                    self.progress.update(
-                        task_id,
-                        completed=advance,
-                        description=f"{stage_name}: {description}",
-                    )
-                else:
-                    self.progress.update(task_id, completed=advance)
-            else:
-                # 增量进度更新
-                if description:
-                    self.progress.update(
-                        task_id,
-                        advance=advance,
-                        description=f"{stage_name}: {description}",
-                    )
+            with self._update_lock:
+                if absolute:
+                    # 绝对进度设置
+                    if description:
+                        self.progress.update(
+                            task_id,
+                            completed=advance,
+                            description=f"{stage_name}: {description}",
+                        )
+                    else:
+                        self.progress.update(task_id, completed=advance)
                 else:
-                    self.progress.update(task_id, advance=advance)
+                    # 增量进度更新
+                    if description:
+                        self.progress.update(
+                            task_id,
+                            advance=advance,
+                            description=f"{stage_name}: {description}",
+                        )
+                    else:
+                        self.progress.update(task_id, advance=advance)
 
     def complete_stage(self, stage_name: str):
         """完成阶段.
@@ -4,6 +4,7 @@
 回滚机制 当构建失败时，自动恢复到之前的状态.
 """
 
+import contextlib
 import json
 import shutil
 import time
@@ -12,6 +13,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from .file_ops import fast_copyfile
+
 
 class OperationType(Enum):
     """
@@ -79,6 +82,9 @@ class RollbackManager:
         # 操作日志文件
         self.log_file = self.rollback_dir / f"operations_{self.session_id}.json"
 
+        # batch() 嵌套深度；大于 0 时 _save_operations 延迟到批量结束
+        self._batch_depth = 0
+
     def __enter__(self):
         """
         进入上下文管理器.
@@ -133,7 +139,7 @@ class RollbackManager:
         backup_path = self.backup_dir / backup_filename
 
         try:
-            shutil.copy2(file_path, backup_path)
+            fast_copyfile(str(file_path), str(backup_path))
 
             operation = RollbackOperation(
                 operation_type=OperationType.MODIFY_FILE,
@@ -159,7 +165,7 @@ class RollbackManager:
         backup_path = self.backup_dir / backup_filename
 
         try:
-            shutil.copy2(file_path, backup_path)
+            fast_copyfile(str(file_path), str(backup_path))
 
             operation = RollbackOperation(
                 operation_type=OperationType.DELETE_FILE,
@@ -243,6 +249,50 @@ class RollbackManager:
             self._log_error(f"删除文件失败: {file_path}, 错误: {e}")
             raise
 
+    def safe_delete_files(self, file_paths) -> None:
+        """批量安全删除文件（带回滚跟踪）.
+
+        逐文件备份后删除，但操作记录只在最后落盘一次：清理
+        PyInstaller dist/ 这类上千文件的目录时，逐文件调用
+        safe_delete_file 会把完整操作日志重写 N 遍。
+
+        Args:
+            file_paths: 待删除的文件路径列表
+        """
+        recorded = False
+        try:
+            for file_path in file_paths:
+                file_path = Path(file_path)
+                if not file_path.exists():
+                    continue
+
+                backup_filename = f"{file_path.name}_{len(self.operations)}_deleted"
+                backup_path = self.backup_dir / backup_filename
+
+                try:
+                    fast_copyfile(str(file_path), str(backup_path))
+                except Exception as e:
+                    self._log_warning(f"备份待删除文件失败: {file_path}, 错误: {e}")
+                    continue
+
+                self.operations.append(
+                    RollbackOperation(
+                        operation_type=OperationType.DELETE_FILE,
+                        target_path=str(file_path),
+                        backup_path=str(backup_path),
+                    )
+                )
+                recorded = True
+
+                try:
+                    file_path.unlink()
+                except Exception as e:
+                    self._log_error(f"删除文件失败: {file_path}, 错误: {e}")
+                    raise
+        finally:
+            if recorded:
+                self._save_operations()
+
     def safe_move_file(self, src_path: Path, dst_path: Path) -> None:
         """
         安全移动文件（带回滚跟踪）
@@ -315,7 +365,7 @@ class RollbackManager:
             elif operation.operation_type == OperationType.MODIFY_FILE:
                 # 恢复文件内容
                 if operation.backup_path and Path(operation.backup_path).exists():
-                    shutil.copy2(operation.backup_path, target_path)
+                    fast_copyfile(operation.backup_path, str(target_path))
                     self._log_debug(f"回滚: 恢复文件 {target_path}")
                 return True
 
@@ -323,7 +373,7 @@ class RollbackManager:
                 # 恢复删除的文件
                 if operation.backup_path and Path(operation.backup_path).exists():
                     target_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(operation.backup_path, target_path)
+                    fast_copyfile(operation.backup_path, str(target_path))
                     self._log_debug(f"回滚: 恢复删除的文件 {target_path}")
                 return True
 
@@ -362,10 +412,29 @@ class RollbackManager:
         except Exception as e:
             self._log_warning(f"清理回滚数据失败: {e}")
 
+    @contextlib.contextmanager
+    def batch(self):
+        """批量记录上下文管理器.
+
+        块内的所有跟踪操作只在内存中累积，退出时一次性落盘。
+        --clean 清理上千文件时避免每个操作重写一遍完整日志。
+        支持嵌套，最外层退出时写盘。
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._save_operations()
+
     def _save_operations(self) -> None:
         """
-        保存操作记录到文件.
+        保存操作记录到文件（批量模式下延迟到批量结束）.
         """
+        if self._batch_depth:
+            return
+
         try:
             operations_data = [asdict(op) for op in self.operations]
             # 将枚举转换为字符串
@@ -378,36 +447,52 @@ class RollbackManager:
         except Exception as e:
             self._log_warning(f"保存操作记录失败: {e}")
 
-    def load_operations(self, session_id: str) -> bool:
-        """
-        从文件加载操作记录.
+    def _read_session_operations(
+        self, session_id: str
+    ) -> Optional[List[RollbackOperation]]:
+        """读取指定会话的操作记录（只读，不修改实例状态）.
+
+        Args:
+            session_id: 会话ID
+
+        Returns:
+            Optional[List[RollbackOperation]]: 操作记录列表，加载失败时为None
         """
         log_file = self.rollback_dir / f"operations_{session_id}.json"
 
         if not log_file.exists():
-            return False
+            return None
 
         try:
-            with open(log_file, "r", encoding="utf-8") as f:
-                operations_data = json.load(f)
+            with open(log_file, "rb") as f:
+                operations_data = json.loads(f.read())
 
-            self.operations = []
+            operations = []
             for op_data in operations_data:
                 # 将字符串转换回枚举
                 op_data["operation_type"] = OperationType(op_data["operation_type"])
-                operation = RollbackOperation(**op_data)
-                self.operations.append(operation)
-
-            self.session_id = session_id
-            self.backup_dir = self.rollback_dir / f"backup_{session_id}"
-            self.log_file = log_file
-
-            return True
+                operations.append(RollbackOperation(**op_data))
+            return operations
 
         except Exception as e:
             self._log_error(f"加载操作记录失败: {e}")
+            return None
+
+    def load_operations(self, session_id: str) -> bool:
+        """
+        从文件加载操作记录.
+        """
+        operations = self._read_session_operations(session_id)
+        if operations is None:
             return False
 
+        self.operations = operations
+        self.session_id = session_id
+        self.backup_dir = self.rollback_dir / f"backup_{session_id}"
+        self.log_file = self.rollback_dir / f"operations_{session_id}.json"
+
+        return True
+
     def list_rollback_sessions(self) -> List[str]:
         """
         列出可用的回滚会话.
@@ -425,26 +510,24 @@ class RollbackManager:
 
     def get_session_info(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
-        获取会话信息.
+        获取会话信息（只读，可并行调用）.
         """
-        if not self.load_operations(session_id):
-            return None
-
-        if not self.operations:
+        operations = self._read_session_operations(session_id)
+        if not operations:
             return None
 
         return {
             "session_id": session_id,
-            "operation_count": len(self.operations),
-            "start_time": min(op.timestamp for op in self.operations),
-            "end_time": max(op.timestamp for op in self.operations),
+            "operation_count": len(operations),
+            "start_time": min(op.timestamp for op in operations),
+            "end_time": max(op.timestamp for op in operations),
             "operations": [
                 {
                     "type": op.operation_type.value,
                     "target": op.target_path,
                     "timestamp": op.timestamp,
                 }
-                for op in self.operations
+                for op in operations
             ],
         }
 
@@ -14,6 +14,8 @@ from typing import Dict, List, Optional
 
 import requests
 
+from .command_runner import cached_which
+
 
 class ToolManager:
     """
@@ -441,9 +443,7 @@ class ToolManager:
                     return path
 
             # 检查PATH
-            import shutil
-
-            path_found = shutil.which("ISCC.exe")
+            path_found = cached_which("ISCC.exe")
             if path_found:
                 return path_found
 
@@ -700,7 +700,7 @@ class ToolManager:
         elif tool_name == "appimagetool":
             return self._check_appimagetool()
         else:
-            return shutil.which(tool_name) is not None
+            return cached_which(tool_name) is not None
 
     def _check_inno_setup(self, config: dict = None) -> bool:
         """检查 Inno Setup 是否可用.
@@ -739,7 +739,7 @@ class ToolManager:
         Returns:
             bool: 是否可用
         """
-        return shutil.which("dpkg-deb") is not None
+        return cached_which("dpkg-deb") is not None
 
     def _check_rpmbuild(self) -> bool:
         """检查 rpmbuild 是否可用.
@@ -747,7 +747,7 @@ class ToolManager:
         Returns:
             bool: 是否可用
         """
-        return shutil.which("rpmbuild") is not None
+        return cached_which("rpmbuild") is not None
 
     def _check_appimagetool(self) -> bool:
         """检查 appimagetool 是否可用.
@@ -755,7 +755,7 @@ class ToolManager:
         Returns:
             bool: 是否可用
         """
-        return shutil.which("appimagetool") is not None
+        return cached_which("appimagetool") is not None
 
     # ------------------------------------------------------------------ #
     #  Auto-install methods                                                #
@@ -779,9 +779,13 @@ class ToolManager:
         installer = installers.get(tool_name)
         if installer:
             try:
-                return installer()
+                success = installer()
             except Exception:
                 return False
+            if success:
+                # 新安装的工具会改变 PATH 查找结果，失效 which 缓存
+                cached_which.cache_clear()
+            return success
         return False
 
     def _auto_install_appimagetool(self) -> bool: